@@ -0,0 +1,25 @@
+# python -m api.commands.rebuild_task_counters [user_id]
+
+import sys
+import logging
+from typing import Final
+from api.configs.db.database import SessionLocal
+from api.models.entities.user_entity import UserEntity
+from api.repositories.providers.provider_task_repository import TaskRepositoryProvider
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s"
+)
+logger: Final[logging.Logger] = logging.getLogger(__name__)
+
+def main(argv: list[str]):
+    user_id: Final[int | None] = int(argv[0]) if argv else None
+
+    with SessionLocal.begin() as db:
+        TaskRepositoryProvider(db).rebuild_counters(user_id)
+
+    logger.info("Task counters rebuilt for %s", f"user {user_id}" if user_id is not None else "all users")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
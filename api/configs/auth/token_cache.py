@@ -0,0 +1,81 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Final
+
+class TokenCache:
+    """Claims of tokens that already passed verification, kept until the token's exp.
+
+    Keyed by a SHA-256 of the token so the tokens themselves are not held in memory. Least recently used
+    entries are evicted past `max_size`; a `max_size` of 0 turns the cache off.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: Final[OrderedDict[bytes, tuple[dict, float]]] = OrderedDict()
+        self._lock: Final[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        if self.max_size <= 0:
+            return None
+
+        key: Final[bytes] = self._key(token)
+
+        with self._lock:
+            entry: Final[tuple[dict, float] | None] = self._entries.get(key)
+
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return dict(entry[0])
+
+    def put(self, token: str, claims: dict):
+        if self.max_size <= 0 or "exp" not in claims:
+            return
+
+        with self._lock:
+            self._entries[self._key(token)] = (dict(claims), float(claims["exp"]))
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, token: str):
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            for key in [key for key, (claims, _) in self._entries.items() if claims.get("sub") == str(user_id)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+token_cache: Final[TokenCache] = TokenCache(int(os.getenv("TOKEN_CACHE_SIZE", "10000")))
@@ -0,0 +1,27 @@
+import os
+from sqlalchemy.orm import Session
+from api.configs.db.unit_of_work import after_write_commit, deleted_user_ids
+from api.services.base.base_user_cache import BaseUserCache
+from api.services.providers.provider_local_user_cache import LocalUserCacheProvider
+from typing import Final
+
+USER_CACHE_URL: Final[str | None] = os.getenv("USER_CACHE_URL")
+USER_CACHE_TTL_SECONDS: Final[float] = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
+def user_cache_from_env() -> BaseUserCache:
+    if USER_CACHE_URL:
+        from api.services.providers.provider_redis_user_cache import RedisUserCacheProvider
+
+        return RedisUserCacheProvider(USER_CACHE_URL, USER_CACHE_TTL_SECONDS)
+
+    return LocalUserCacheProvider(USER_CACHE_TTL_SECONDS, int(os.getenv("USER_CACHE_SIZE", "10000")))
+
+user_cache: Final[BaseUserCache] = user_cache_from_env()
+
+def invalidate_deleted_users(session: Session, created_user_ids: set[int]):
+    # the service already invalidated before the commit, but a request in between could have cached the
+    # user again from the not yet committed row, so it is dropped once more when the delete is durable
+    for user_id in deleted_user_ids(session):
+        user_cache.invalidate(user_id)
+
+after_write_commit(invalidate_deleted_users)
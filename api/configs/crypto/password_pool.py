@@ -0,0 +1,101 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from api.utils.res.response_body import ResponseBody
+from datetime import datetime
+from typing import Callable, Final, TypeVar
+
+T = TypeVar("T")
+
+class PasswordPoolFullError(Exception):
+    pass
+
+class PasswordPool:
+    """Runs the bcrypt calls on their own workers, off the event loop and the request threadpool.
+
+    At most `max_pending` calls are queued or running; past that a call fails right away with
+    PasswordPoolFullError, answered with a 503, instead of piling up behind a login storm.
+    """
+
+    def __init__(self, workers: int, max_pending: int, kind: str = "process"):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.kind = kind
+        self.pending: int = 0
+        self.rejected: int = 0
+        self.initializer: Callable[..., None] | None = None
+        self.initargs: tuple = ()
+        self._executor: Executor | None = None
+
+    def configure_workers(self, initializer: Callable[..., None], *initargs):
+        """Runs initializer(*initargs) in each worker before its first call; workers already started are replaced."""
+        self.initializer = initializer
+        self.initargs = initargs
+        self.shutdown()
+
+    def _get_executor(self, call: Callable) -> Executor:
+        # created on first use, so importing the app doesn't start workers
+        if self._executor is None:
+            self._executor = (
+                ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=self._mp_context(call), initializer=self.initializer, initargs=self.initargs
+                )
+                if self.kind == "process"
+                else ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password", initializer=self.initializer, initargs=self.initargs
+                )
+            )
+
+        return self._executor
+
+    def _mp_context(self, call: Callable):
+        # not fork: a forked worker copies the server's threads, locks and open connections mid-use
+        if "forkserver" not in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("spawn")
+
+        context: Final = multiprocessing.get_context("forkserver")
+        # imported once by the fork server when it starts, so new workers don't import the app again
+        modules: Final[set[str]] = {call.__module__} | ({self.initializer.__module__} if self.initializer is not None else set())
+        context.set_forkserver_preload(sorted(modules))
+
+        return context
+
+    async def run(self, call: Callable[..., T], *args) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordPoolFullError()
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(call), call, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+async def password_pool_full_handler(request: Request, exc: PasswordPoolFullError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+        content=dict(ResponseBody[None](
+            code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message="Too many logins right now, please try again",
+            status=False,
+            body=None,
+            datetime = str(datetime.now())
+        ))
+    )
+
+PASSWORD_WORKERS: Final[int] = int(os.getenv("PASSWORD_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+password_pool: Final[PasswordPool] = PasswordPool(
+    workers=PASSWORD_WORKERS,
+    max_pending=int(os.getenv("PASSWORD_MAX_PENDING", str(PASSWORD_WORKERS * 16))),
+    kind=os.getenv("PASSWORD_POOL", "process"),
+)
@@ -1,9 +1,13 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, DateTime, URL, inspect, make_url
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, Session
 from sqlalchemy.orm.session import sessionmaker
 from typing import Final, Any
+from api.configs.db.pool import PoolSettings, engine_options
+from api.configs.db.replica import RecentWrites, track_writes
 
 load_dotenv()
 
@@ -12,12 +16,56 @@ DATABASE_URL: Final[str | None] = os.getenv("DATABASE_URL")
 if DATABASE_URL == None:
     raise ValueError("DATABASE_URL is none")
 
-engine: Final[Engine] = create_engine(DATABASE_URL, echo=True)
+database_url: Final[URL] = make_url(DATABASE_URL)
+
+# an async driver in the url (postgresql+asyncpg, sqlite+aiosqlite) serves requests through AsyncSession,
+# the sync engine on the default driver is kept for create_tables and the commands
+ASYNC_DATABASE: Final[bool] = getattr(database_url.get_dialect(), "is_async", False)
+
+POOL_SETTINGS: Final[PoolSettings] = PoolSettings.from_env()
+
+sync_database_url: Final[URL] = database_url.set(drivername=database_url.get_backend_name()) if ASYNC_DATABASE else database_url
+
+engine: Final[Engine] = create_engine(sync_database_url, **engine_options(sync_database_url, POOL_SETTINGS))
 
 SessionLocal: Final[sessionmaker[Session]] = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
+async_engine: Final[AsyncEngine | None] = (
+    create_async_engine(database_url, **engine_options(database_url, POOL_SETTINGS)) if ASYNC_DATABASE else None
+)
+
+AsyncSessionLocal: Final[async_sessionmaker[AsyncSession] | None] = (
+    async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False) if ASYNC_DATABASE else None
+)
+
+# optional read-only replica, same driver family as DATABASE_URL; reads of a user who just wrote stay on the primary
+DATABASE_REPLICA_URL: Final[str | None] = os.getenv("DATABASE_REPLICA_URL")
+READ_YOUR_WRITES_SECONDS: Final[float] = float(os.getenv("DATABASE_READ_YOUR_WRITES_SECONDS", "5"))
+
+replica_url: Final[URL | None] = make_url(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
+
+ReplicaSessionLocal: Final[sessionmaker[Session] | None] = (
+    sessionmaker(autoflush=False, bind=create_engine(replica_url, **engine_options(replica_url, POOL_SETTINGS)), expire_on_commit=False)
+    if replica_url is not None and not ASYNC_DATABASE else None
+)
+
+AsyncReplicaSessionLocal: Final[async_sessionmaker[AsyncSession] | None] = (
+    async_sessionmaker(bind=create_async_engine(replica_url, **engine_options(replica_url, POOL_SETTINGS)), autoflush=False, expire_on_commit=False)
+    if replica_url is not None and ASYNC_DATABASE else None
+)
+
+recent_writes: Final[RecentWrites] = RecentWrites(READ_YOUR_WRITES_SECONDS)
+track_writes(recent_writes)
+
 Base: Final[Any] = declarative_base()
 
+# SQLite's CURRENT_TIMESTAMP has second precision, bind datetimes in the same format
+# so range and keyset comparisons against server defaults behave like on Postgres.
+TimestampTZ: Final = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
+
 def get_db():
     db: Final[Session] = SessionLocal()
     try:
@@ -26,8 +74,61 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_replica_db():
+    if ReplicaSessionLocal is None:
+        yield None
+        return
+
+    db: Final[Session] = ReplicaSessionLocal()
+    try:
+        yield db
+
+    finally:
+        db.close()
+
+async def get_async_replica_db():
+    if AsyncReplicaSessionLocal is None:
+        yield None
+        return
+
+    async with AsyncReplicaSessionLocal() as db:
+        yield db
+
+get_session: Final = get_async_db if ASYNC_DATABASE else get_db
+
+get_replica_session: Final = get_async_replica_db if ASYNC_DATABASE else get_replica_db
+
 def create_tables():
     from api.models.entities.user_entity import UserEntity
     from api.models.entities.task_entity import TaskEntity
-    
+    from api.models.entities.task_counter_entity import TaskCounterEntity
+    from api.models.entities.task_tombstone_entity import TaskTombstoneEntity
+    from api.models.entities.task_change_sequence_entity import TaskChangeSequenceEntity
+    from api.repositories.providers.provider_task_repository import TaskRepositoryProvider
+
+    counters_existed: Final[bool] = inspect(engine).has_table(TaskCounterEntity.__tablename__)
+
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips tables that already exist, so columns and indexes added later are created here;
+    # rows written before change_seq existed keep 0 and come first in the change feed
+    for table in (TaskEntity.__table__, TaskTombstoneEntity.__table__):
+        if "change_seq" not in {column["name"] for column in inspect(engine).get_columns(table.name)}:
+            with engine.begin() as connection:
+                connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0")
+
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    from api.configs.db.task_search import install_task_search
+
+    with engine.begin() as connection:
+        install_task_search(connection)
+
+    if not counters_existed:
+        with SessionLocal.begin() as db:
+            TaskRepositoryProvider(db).rebuild_counters()
@@ -0,0 +1,88 @@
+import os
+import time
+from pydantic import BaseModel
+from sqlalchemy import URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from typing import Any, Final
+
+class PoolSettings(BaseModel):
+    size: int = 5
+    max_overflow: int = 10
+    timeout: float = 30
+    recycle: int = 1800
+    pre_ping: bool = True
+    statement_timeout_ms: int = 0
+    echo: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        env: Final[dict[str, str]] = {
+            field: os.environ[f"DB_{field.upper()}"]
+            for field in cls.model_fields
+            if f"DB_{field.upper()}" in os.environ
+        }
+        return cls.model_validate(env)
+
+class TimedPoolMixin:
+    """Counts checkouts and the time each one took to get a connection."""
+
+    checkouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def _do_get(self):
+        started: Final[float] = time.perf_counter()
+        try:
+            return super()._do_get()
+
+        finally:
+            waited: float = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def engine_options(url: URL, settings: PoolSettings) -> dict[str, Any]:
+    options: Final[dict[str, Any]] = {"echo": settings.echo, "pool_pre_ping": settings.pre_ping}
+
+    # in-memory SQLite lives in a single connection, so it keeps SQLAlchemy's default pool
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if getattr(url.get_dialect(), "is_async", False) else TimedQueuePool,
+        pool_size=settings.size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.timeout,
+        pool_recycle=settings.recycle,
+    )
+
+    if settings.statement_timeout_ms > 0 and url.get_backend_name() == "postgresql":
+        # set when the connection opens, so it survives the rollback on every pool check-in
+        options["connect_args"] = (
+            {"server_settings": {"statement_timeout": str(settings.statement_timeout_ms)}}
+            if url.get_driver_name() == "asyncpg"
+            else {"options": f"-c statement_timeout={settings.statement_timeout_ms}"}
+        )
+
+    return options
+
+def pool_metrics(pool: Pool) -> dict[str, Any]:
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": getattr(pool, "checkouts", 0),
+        "wait_seconds_total": round(getattr(pool, "wait_seconds_total", 0.0), 6),
+        "wait_seconds_max": round(getattr(pool, "wait_seconds_max", 0.0), 6),
+    }
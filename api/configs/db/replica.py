@@ -0,0 +1,48 @@
+import threading
+import time
+from sqlalchemy.orm import Session
+from api.configs.db.unit_of_work import after_write_commit
+from typing import Final
+
+class RecentWrites:
+    """Users who wrote in the last `window` seconds, whose reads stay on the primary until the replica catches up.
+
+    Kept per process: with several workers a user can still land on a worker that didn't see the write,
+    so the window should cover the replica lag rather than rely on it.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._until: Final[dict[int, float]] = {}
+        self._lock: Final[threading.Lock] = threading.Lock()
+
+    def record(self, user_id: int):
+        now: Final[float] = time.monotonic()
+
+        with self._lock:
+            self._until[user_id] = now + self.window
+
+            if len(self._until) > 10_000:
+                for expired in [key for key, until in self._until.items() if until <= now]:
+                    del self._until[expired]
+
+    def is_recent(self, user_id: int) -> bool:
+        with self._lock:
+            return self._until.get(user_id, 0.0) > time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._until.clear()
+
+def track_writes(recent_writes: RecentWrites):
+    """Opens the window for the session's user (session.info["user_id"]) and any user it created on each write commit."""
+
+    def record(session: Session, created_user_ids: set[int]):
+        user_ids: Final[set[int]] = set(created_user_ids)
+        if session.info.get("user_id") is not None:
+            user_ids.add(session.info["user_id"])
+
+        for user_id in user_ids:
+            recent_writes.record(user_id)
+
+    after_write_commit(record)
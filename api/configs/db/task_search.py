@@ -0,0 +1,69 @@
+from sqlalchemy import Connection, Select, Table, event, func, inspect, literal_column, table, column
+from typing import Final
+
+SEARCH_CONFIG: Final[str] = "simple"
+
+POSTGRES_DDL: Final[list[str]] = [
+    f"""ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || coalesce(description, ''))) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+]
+
+SQLITE_DDL: Final[list[str]] = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(title, description, content='tasks', content_rowid='id')",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+tasks_fts: Final = table("tasks_fts", column("rowid"), column("rank"))
+
+def install_task_search(connection: Connection):
+    dialect: Final[str] = connection.dialect.name
+
+    if dialect == "postgresql":
+        for ddl in POSTGRES_DDL:
+            connection.exec_driver_sql(ddl)
+
+    elif dialect == "sqlite":
+        exists: Final[bool] = inspect(connection).has_table("tasks_fts")
+
+        for ddl in SQLITE_DDL:
+            connection.exec_driver_sql(ddl)
+
+        if not exists:
+            connection.exec_driver_sql("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+def uninstall_task_search(connection: Connection):
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS tasks_fts")
+
+def register_task_search(tasks: Table):
+    event.listen(tasks, "after_create", lambda target, connection, **kw: install_task_search(connection))
+    event.listen(tasks, "before_drop", lambda target, connection, **kw: uninstall_task_search(connection))
+
+def sqlite_match_query(q: str) -> str:
+    return " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+
+def apply_task_search(stmt: Select, q: str, dialect: str) -> Select:
+    if dialect == "postgresql":
+        search_vector: Final = literal_column("tasks.search_vector")
+        query: Final = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+        return stmt.where(search_vector.bool_op("@@")(query)).order_by(func.ts_rank(search_vector, query).desc())
+
+    if dialect == "sqlite":
+        return (
+            stmt.join(tasks_fts, tasks_fts.c.rowid == literal_column("tasks.id"))
+            .where(literal_column("tasks_fts").op("MATCH")(sqlite_match_query(q)))
+            .order_by(tasks_fts.c.rank)
+        )
+
+    raise ValueError(f"Full-text search is not supported on {dialect}")
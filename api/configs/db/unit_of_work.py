@@ -0,0 +1,93 @@
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from typing import Callable, Final
+
+write_commit_listeners: Final[list[Callable[[Session, set[int]], None]]] = []
+
+def after_write_commit(listener: Callable[[Session, set[int]], None]):
+    """Calls listener(session, created_user_ids) after each commit of a transaction that wrote."""
+    write_commit_listeners.append(listener)
+
+def has_writes(session: Session) -> bool:
+    return session.info.get("wrote", False)
+
+def deleted_user_ids(session: Session) -> set[int]:
+    """Users deleted by the transaction being committed; only meaningful inside an after_write_commit listener."""
+    return session.info.get("deleted_user_ids", set())
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(state: ORMExecuteState):
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["wrote"] = True
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context):
+    from api.models.entities.user_entity import UserEntity
+
+    session.info["wrote"] = True
+    session.info.setdefault("created_user_ids", set()).update(
+        user.id for user in session.new if isinstance(user, UserEntity)
+    )
+    session.info.setdefault("deleted_user_ids", set()).update(
+        user.id for user in session.deleted if isinstance(user, UserEntity)
+    )
+
+@event.listens_for(Session, "after_commit")
+def _notify_commit(session: Session):
+    # also fired when a savepoint is released, the transaction is still open then
+    if session.in_nested_transaction():
+        return
+
+    created_user_ids: Final[set[int]] = session.info.pop("created_user_ids", set())
+    try:
+        if not session.info.pop("wrote", False):
+            return
+
+        for listener in write_commit_listeners:
+            listener(session, created_user_ids)
+
+    finally:
+        session.info.pop("deleted_user_ids", None)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rollback(session: Session):
+    if session.in_nested_transaction():
+        return
+
+    session.info.pop("wrote", None)
+    session.info.pop("created_user_ids", None)
+    session.info.pop("deleted_user_ids", None)
+
+def savepoint(session: Session) -> SessionTransaction:
+    """SAVEPOINT inside the request's transaction; used as a context manager it rolls back only its own part on error."""
+    return session.begin_nested()
+
+class UnitOfWork:
+    """One transaction per request. Repositories only flush; the request commits once when it ends
+    without an error and rolls back otherwise."""
+
+    def __init__(self, db: Session | AsyncSession):
+        self.db = db
+
+    async def commit(self):
+        if isinstance(self.db, AsyncSession):
+            await self.db.commit()
+        else:
+            await run_in_threadpool(self.db.commit)
+
+    async def rollback(self):
+        if isinstance(self.db, AsyncSession):
+            await self.db.rollback()
+        else:
+            await run_in_threadpool(self.db.rollback)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
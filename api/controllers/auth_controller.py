@@ -1,23 +1,20 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
-from api.models.schemas.user_schemas import CreateUserDTO, LoginDTO
+from api.models.schemas.user_schemas import CreateUserDTO, LoginDTO, Principal
 from fastapi.responses import JSONResponse
 from api.models.entities.user_entity import UserEntity
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Final
 from api.utils.res.response_body import ResponseBody
 from api.utils.res.tokens import Tokens
 from api.utils.res.responses_http import *
 from api.models.schemas.user_schemas import CreateUserDTO
-from api.services.providers.provider_user_service import UserServiceProvider
+from api.services.providers.provider_async_user_service import AsyncUserServiceProvider
 from api.dependencies.service_dependency import *
 from datetime import datetime
-from api.services.providers.provider_crypto_service import verify_password
+from api.services.providers.provider_crypto_service import verify_and_update_password_async
 
 router: Final[APIRouter] = APIRouter(prefix="/api/v1/auth", tags=["auth"])
 
-bearer_scheme: Final[HTTPBearer] = HTTPBearer()
-
 @router.get(
     "/{refresh_token}",
     status_code=200,
@@ -27,39 +24,13 @@ bearer_scheme: Final[HTTPBearer] = HTTPBearer()
         404: RESPONSE_404_USER
     }
 )
-def refresh_token_method(
-    refresh_token: str,
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
+async def refresh_token_method(
+    principal: Principal = Depends(get_refresh_principal),
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
     jwt_service: BaseJwtService = Depends(get_jwt_service),
     ):
     
-    check_token = jwt_service.decode_token(refresh_token)
-    if check_token is None:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content=dict(ResponseBody[None](
-                code=status.HTTP_401_UNAUTHORIZED,
-                message="You are not authorized",
-                status=False,
-                body=None,
-                datetime = str(datetime.now())
-            ))
-        )
-
-    user_id: Final[int | None] = jwt_service.extract_user_id(refresh_token)
-    if user_id is None:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content=dict(ResponseBody[None](
-                code=status.HTTP_401_UNAUTHORIZED,
-                message="You are not authorized",
-                status=False,
-                body=None,
-                datetime = str(datetime.now())
-            ))
-        )
-
-    user: Final[UserEntity | None] = user_service.get_by_id(user_id)
+    user: Final[UserEntity | None] = await user_service.get_by_id(principal.user_id)
     if user is None:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +46,7 @@ def refresh_token_method(
     token: Final[str] = jwt_service.create_access_token(user)
     new_refresh_token: Final[str] = jwt_service.create_refresh_token(user)
 
-    user_service.set_refresh_token(new_refresh_token, user)
+    await user_service.set_refresh_token(new_refresh_token, user)
 
     tokens: Final[Tokens] = Tokens(token=token, refresh_token=new_refresh_token)
 
@@ -98,15 +69,17 @@ def refresh_token_method(
     description="endpoint to register new user",
     responses={
         409: { "model": ResponseBody[None], "description": "Email already exists" },
-        404: RESPONSE_404_USER
+        404: RESPONSE_404_USER,
+        503: RESPONSE_503_PASSWORD
     }
     )
-def resgiter(
+async def resgiter(
     dto: CreateUserDTO,
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
     jwt_service: BaseJwtService = Depends(get_jwt_service)
 ):
-    if user_service.exists_by_email(dto.email):
+    user_created: Final[UserEntity | None] = None if await user_service.exists_by_email(dto.email) else await user_service.create(dto)
+    if user_created is None:
         return JSONResponse(
             status_code=status.HTTP_409_CONFLICT,
             content=dict(ResponseBody[None](
@@ -117,13 +90,11 @@ def resgiter(
                 datetime=str(datetime.now())
             ))
         )
-    
-    user_created: Final[UserEntity] = user_service.create(dto)
 
     token: Final[str] = jwt_service.create_access_token(user_created)
     refresh_token: Final[str] = jwt_service.create_refresh_token(user_created)
 
-    user_service.set_refresh_token(refresh_token, user_created)
+    await user_service.set_refresh_token(refresh_token, user_created)
 
     tokens: Final[Tokens] = Tokens(token=token, refresh_token=refresh_token)
 
@@ -146,15 +117,16 @@ def resgiter(
     description="endpoint to login user",
     responses={
         404: RESPONSE_404_USER,
-        401: RESPONSE_401
+        401: RESPONSE_401,
+        503: RESPONSE_503_PASSWORD
     }
 )
-def login(
+async def login(
     dto: LoginDTO,
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
     jwt_service: BaseJwtService = Depends(get_jwt_service)
 ):
-    user: Final[UserEntity] = user_service.get_by_email(dto.email)
+    user: Final[UserEntity] = await user_service.get_by_email(dto.email)
     if user is None:
         return JSONResponse(
             status_code=401,
@@ -167,7 +139,8 @@ def login(
             ))
         )
 
-    if verify_password(dto.password,user.password) == False :
+    valid, password_hash = await verify_and_update_password_async(dto.password, user.password)
+    if valid == False :
         return JSONResponse(
             status_code=401,
             content=dict(ResponseBody[None](
@@ -179,10 +152,14 @@ def login(
             ))
         )
 
+    # hashed with another cost than the calibrated one, the password is at hand to hash it again
+    if password_hash is not None:
+        await user_service.set_password_hash(password_hash, user)
+
     token: Final[str] = jwt_service.create_access_token(user)
     refresh_token: Final[str] = jwt_service.create_refresh_token(user)
 
-    user_service.set_refresh_token(refresh_token, user)
+    await user_service.set_refresh_token(refresh_token, user)
 
     tokens: Final[Tokens] = Tokens(token=token, refresh_token=refresh_token)
 
@@ -0,0 +1,102 @@
+import hmac
+import os
+from fastapi import APIRouter, Depends, Header, status
+from fastapi.responses import JSONResponse
+from typing import Final, Any
+from api.utils.res.response_body import ResponseBody
+from api.utils.res.responses_http import RESPONSE_401
+from api.dependencies.service_dependency import NotAuthorizedError
+from api.configs.db.database import engine, async_engine, ReplicaSessionLocal, AsyncReplicaSessionLocal
+from api.configs.db.pool import pool_metrics
+from api.configs.auth.token_cache import token_cache
+from api.configs.crypto.password_pool import password_pool
+from api.services.providers import provider_crypto_service
+from datetime import datetime
+
+# the numbers describe the whole deployment (how close login is to shedding, the bcrypt cost), so they are only
+# served to operators holding METRICS_TOKEN, never to a signed-in user; without the token the routes aren't mounted
+METRICS_TOKEN: str | None = os.getenv("METRICS_TOKEN") or None
+METRICS_ENABLED: Final[bool] = METRICS_TOKEN is not None
+
+def require_metrics_token(x_metrics_token: str | None = Header(None)):
+    if METRICS_TOKEN is None or x_metrics_token is None or not hmac.compare_digest(x_metrics_token, METRICS_TOKEN):
+        raise NotAuthorizedError()
+
+router: Final[APIRouter] = APIRouter(
+    prefix="/api/v1/metrics",
+    tags=["Metrics"],
+    dependencies=[Depends(require_metrics_token)],
+    responses={401: RESPONSE_401},
+)
+
+@router.get(
+    "/pool",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[dict[str, dict[str, Any]]],
+    description="Live connection pool numbers, to size workers against the database's max_connections",
+)
+async def get_pool_metrics():
+    pools: Final[dict[str, dict[str, Any]]] = {"sync": pool_metrics(engine.pool)}
+    if async_engine is not None:
+        pools["async"] = pool_metrics(async_engine.pool)
+    if ReplicaSessionLocal is not None:
+        pools["replica"] = pool_metrics(ReplicaSessionLocal.kw["bind"].pool)
+    if AsyncReplicaSessionLocal is not None:
+        pools["replica"] = pool_metrics(AsyncReplicaSessionLocal.kw["bind"].pool)
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=dict(ResponseBody[dict](
+            code=status.HTTP_200_OK,
+            message="Pool metrics",
+            status=True,
+            body=pools,
+            datetime = str(datetime.now())
+        ))
+    )
+
+@router.get(
+    "/token-cache",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[dict[str, Any]],
+    description="Size and hit rate of the verified-token cache",
+)
+async def get_token_cache_metrics():
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=dict(ResponseBody[dict](
+            code=status.HTTP_200_OK,
+            message="Token cache metrics",
+            status=True,
+            body=token_cache.metrics(),
+            datetime = str(datetime.now())
+        ))
+    )
+
+@router.get(
+    "/password",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[dict[str, Any]],
+    description="Calibrated bcrypt cost, the CPU each login spends on it, and the password pool's load",
+)
+async def get_password_metrics():
+    cost: Final = provider_crypto_service.password_cost
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=dict(ResponseBody[dict](
+            code=status.HTTP_200_OK,
+            message="Password metrics",
+            status=True,
+            body={
+                "cost": cost.model_dump() if cost is not None else None,
+                "pool": {
+                    "workers": password_pool.workers,
+                    "pending": password_pool.pending,
+                    "max_pending": password_pool.max_pending,
+                    "rejected": password_pool.rejected,
+                },
+            },
+            datetime = str(datetime.now())
+        ))
+    )
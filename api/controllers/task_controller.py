@@ -1,22 +1,24 @@
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
-from api.models.entities.user_entity import UserEntity
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Final, Any
 from api.utils.res.response_body import ResponseBody
 from api.utils.res.responses_http import *
-from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO, TaskOUT
-from api.services.providers.provider_user_service import UserServiceProvider
+from api.utils.res.etag import etag_matches
+from api.utils.res.task_export import ExportFormat, EXPORT_MEDIA_TYPES, tasks_to_ndjson, tasks_to_csv
+from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO, TaskOUT, TaskCursorPage, TaskStatsOUT, TaskChangesOUT, TaskBatchOUT, TaskBatchErrorOUT, BulkUpdateTaskDTO, TaskBulkDeleteOUT
+from api.models.schemas.user_schemas import Principal
+from api.services.providers.provider_async_user_service import AsyncUserServiceProvider
+from api.services.providers.provider_async_task_service import AsyncTaskServiceProvider
 from api.dependencies.service_dependency import *
 from datetime import datetime
+from pydantic import ValidationError
+import json
 from api.utils.filters.task_filter import TaskFilter
-from fastapi_pagination import Page, add_pagination, paginate
-from api.models.entities.task_entity import TaskEntity
+from fastapi_pagination import Page, add_pagination, resolve_params, pagination_ctx
+from api.utils.pagination.task_cursor import TaskCursorParams, TaskCursor, TaskChangesCursor, decode_task_cursor, decode_task_changes_cursor
 
 router: Final[APIRouter] = APIRouter(prefix="/api/v1/task", tags=["Task"])
 
-bearer_scheme: Final[HTTPBearer] = HTTPBearer()
-
 @router.put(
     "/{task_id}",
     status_code=status.HTTP_200_OK,
@@ -27,28 +29,14 @@ bearer_scheme: Final[HTTPBearer] = HTTPBearer()
         500: RESPONSE_500,
     }
 )
-def update(
+async def update(
     task_id: int,
     dto: UpdateTaskDTO,
-    task_service: TaskServiceProvider = Depends(get_task_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
-
-        user_id = jwt_service.extract_user_id(token)
-        if user_id is None:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
+        user_id: Final[int] = principal.user_id
 
         if task_id <= 0 or task_id is None:
             return JSONResponse(
@@ -62,8 +50,8 @@ def update(
                     ))
                 )
 
-        task: Final[TaskEntity | None] = task_service.get_by_id(task_id)
-        if task is None:
+        task_out: Final[TaskOUT | None] = await task_service.update_by_id_user_id(task_id, user_id, dto)
+        if task_out is None:
             return JSONResponse(
                     status_code=status.HTTP_404_NOT_FOUND,
                     content=dict(ResponseBody[None](
@@ -75,21 +63,6 @@ def update(
                     ))
                 )
 
-        if user_id != task.user_id:
-            return JSONResponse(
-                status_code=409,
-                content=dict(ResponseBody[None](
-                    code=409,
-                    message="You are not authorized to update this task",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
-
-        task_changed: Final[TaskEntity] = task_service.update(task, dto)
-        task_out: Final[TaskOUT] = task_changed.to_task_out()
-
         return JSONResponse(
                 status_code=status.HTTP_200_OK,
                 content=dict(ResponseBody[dict](
@@ -124,27 +97,13 @@ def update(
         500: RESPONSE_500,
     }
 )
-def change_status_done(
+async def change_status_done(
     task_id: int,
-    task_service: TaskServiceProvider = Depends(get_task_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
-
-        user_id = jwt_service.extract_user_id(token)
-        if user_id is None:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
+        user_id: Final[int] = principal.user_id
 
         if task_id <= 0 or task_id is None:
             return JSONResponse(
@@ -158,8 +117,8 @@ def change_status_done(
                     ))
                 )
 
-        task: Final[TaskEntity | None] = task_service.get_by_id(task_id)
-        if task is None:
+        task_out: Final[TaskOUT | None] = await task_service.change_status_done_by_id_user_id(task_id, user_id)
+        if task_out is None:
             return JSONResponse(
                     status_code=status.HTTP_404_NOT_FOUND,
                     content=dict(ResponseBody[None](
@@ -171,28 +130,77 @@ def change_status_done(
                     ))
                 )
 
-        if user_id != task.user_id:
+        return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content=dict(ResponseBody[dict](
+                    code=status.HTTP_200_OK,
+                    message="Task status changed with successfully",
+                    status=True,
+                    body=dict(task_out),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+    except Exception as e:
+        return JSONResponse(
+                status_code=500,
+                content=dict(ResponseBody[Any](
+                    code=500,
+                    message="Error in server! Please try again later",
+                    status=False,
+                    body=str(e),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+@router.delete(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[TaskBulkDeleteOUT],
+    description="Deletes the given ids, or every task matching the filter, with one DELETE. With stream_ids=true the deleted ids are streamed as NDJSON",
+    responses = {
+        401: RESPONSE_401,
+        500: RESPONSE_500,
+    }
+)
+async def delete_batch(
+    ids: list[int] | None = Query(None, min_length=1, max_length=1000),
+    stream_ids: bool = Query(False),
+    task_filter: TaskFilter = Depends(),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
+):
+    try:
+        user_id: Final[int] = principal.user_id
+
+        if ids is None and len(task_filter.model_dump(exclude_none=True)) == 0:
             return JSONResponse(
-                status_code=409,
+                status_code=status.HTTP_400_BAD_REQUEST,
                 content=dict(ResponseBody[None](
-                    code=409,
-                    message="You are not authorized to change status done this task",
+                    code=status.HTTP_400_BAD_REQUEST,
+                    message="Send ids or at least one filter",
                     status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
-        task_changed: Final[TaskEntity] = task_service.change_status_done(task)
-        task_out: Final[TaskOUT] = task_changed.to_task_out()
+        deleted_ids: Final[list[int]] = await task_service.delete_many(user_id, ids, task_filter)
+
+        if stream_ids:
+            return StreamingResponse(
+                (f"{task_id}\n" for task_id in deleted_ids),
+                media_type=EXPORT_MEDIA_TYPES["ndjson"],
+                headers={"X-Deleted-Count": str(len(deleted_ids))},
+            )
 
         return JSONResponse(
                 status_code=status.HTTP_200_OK,
                 content=dict(ResponseBody[dict](
                     code=status.HTTP_200_OK,
-                    message="Task status changed with successfully",
+                    message=f"{len(deleted_ids)} tasks deleted with successfully",
                     status=True,
-                    body=dict(task_out),
+                    body=TaskBulkDeleteOUT(deleted=len(deleted_ids)).model_dump(),
                     datetime = str(datetime.now())
                 ))
             )
@@ -219,27 +227,13 @@ def change_status_done(
         500: RESPONSE_500,
     }
 )
-def delete_task(
+async def delete_task(
     task_id: int,
-    task_service: TaskServiceProvider = Depends(get_task_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
-
-        user_id = jwt_service.extract_user_id(token)
-        if user_id is None:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
+        user_id: Final[int] = principal.user_id
 
         if task_id <= 0 or task_id is None:
             return JSONResponse(
@@ -253,8 +247,8 @@ def delete_task(
                     ))
                 )
 
-        task: Final[TaskEntity | None] = task_service.get_by_id(task_id)
-        if task is None:
+        deleted: Final[bool] = await task_service.delete_by_id_user_id(task_id, user_id)
+        if not deleted:
             return JSONResponse(
                     status_code=status.HTTP_404_NOT_FOUND,
                     content=dict(ResponseBody[None](
@@ -266,31 +260,130 @@ def delete_task(
                     ))
                 )
 
-        if user_id != task.user_id:
+        return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content=dict(ResponseBody[None](
+                    code=status.HTTP_200_OK,
+                    message="Task deleted with successfully",
+                    status=True,
+                    body=None,
+                    datetime = str(datetime.now())
+                ))
+            )
+
+    except Exception as e:
+        return JSONResponse(
+                status_code=500,
+                content=dict(ResponseBody[Any](
+                    code=500,
+                    message="Error in server! Please try again later",
+                    status=False,
+                    body=str(e),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+@router.get(
+    "/changes",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[TaskChangesOUT],
+    description="Tasks created, updated or deleted after the since cursor, oldest first",
+    responses = {
+        401: RESPONSE_401,
+        500: RESPONSE_500,
+    }
+)
+async def get_changes(
+    since: str | None = Query(None, description="next_cursor of the previous sync, omit it for a full sync."),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of changes returned."),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_read_provider_dependency),
+    principal: Principal = Depends(get_principal),
+):
+    try:
+        user_id: Final[int] = principal.user_id
+
+        cursor: Final[TaskChangesCursor | None] = decode_task_changes_cursor(since) if since else None
+        if since and cursor is None:
             return JSONResponse(
-                status_code=409,
+                status_code=status.HTTP_400_BAD_REQUEST,
                 content=dict(ResponseBody[None](
-                    code=409,
-                    message="You are not authorized to delete this task",
+                    code=status.HTTP_400_BAD_REQUEST,
+                    message="Cursor invalid",
                     status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
-        task_service.delete(task)
+        changes: Final[TaskChangesOUT] = await task_service.get_changes_user_id(user_id, cursor, limit)
 
         return JSONResponse(
                 status_code=status.HTTP_200_OK,
-                content=dict(ResponseBody[None](
+                content=dict(ResponseBody[dict](
                     code=status.HTTP_200_OK,
-                    message="Task deleted with successfully",
+                    message="Task changes found with successfully",
                     status=True,
+                    body=changes.model_dump(mode="json"),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+    except Exception as e:
+        return JSONResponse(
+                status_code=500,
+                content=dict(ResponseBody[Any](
+                    code=500,
+                    message="Error in server! Please try again later",
+                    status=False,
+                    body=str(e),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[TaskStatsOUT],
+    responses = {
+        401: RESPONSE_401,
+        404: RESPONSE_404_USER,
+        500: RESPONSE_500,
+    }
+)
+async def get_stats(
+    task_filter: TaskFilter = Depends(),
+    user_service: AsyncUserServiceProvider = Depends(get_user_read_provider_dependency),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_read_provider_dependency),
+    principal: Principal = Depends(get_principal),
+):
+    try:
+        user_id: Final[int] = principal.user_id
+
+        if not await user_service.exists_by_id(user_id):
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content=dict(ResponseBody[None](
+                    code=status.HTTP_404_NOT_FOUND,
+                    message="User not found",
+                    status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
+        stats: Final[TaskStatsOUT] = await task_service.get_stats_user_id_filtered(user_id, task_filter)
+
+        return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content=dict(ResponseBody[dict](
+                    code=status.HTTP_200_OK,
+                    message="Task stats found with successfully",
+                    status=True,
+                    body=stats.model_dump(mode="json"),
+                    datetime = str(datetime.now())
+                ))
+            )
+
     except Exception as e:
         return JSONResponse(
                 status_code=500,
@@ -304,37 +397,77 @@ def delete_task(
             )
 
 @router.get(
-    "/{task_id}",
+    "/export",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseBody[TaskOUT],
+    description="Streams every task of the user matching the filter as NDJSON or CSV",
     responses = {
         401: RESPONSE_401,
         404: RESPONSE_404_USER,
         500: RESPONSE_500,
     }
 )
-def get_task(
-    task_id: int,
-    task_service: TaskServiceProvider = Depends(get_task_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+async def export(
+    task_filter: TaskFilter = Depends(),
+    format: ExportFormat = Query("ndjson", description="Export format, ndjson or csv."),
+    user_service: AsyncUserServiceProvider = Depends(get_user_read_provider_dependency),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_read_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
+        user_id: Final[int] = principal.user_id
 
-        user_id = jwt_service.extract_user_id(token)
-        if user_id is None:
+        if not await user_service.exists_by_id(user_id):
             return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
+                status_code=status.HTTP_404_NOT_FOUND,
                 content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
+                    code=status.HTTP_404_NOT_FOUND,
+                    message="User not found",
                     status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
+        tasks: Final = task_service.stream_user_id_filtered(user_id, task_filter)
+        content: Final = tasks_to_csv(tasks) if format == "csv" else tasks_to_ndjson(tasks)
+
+        return StreamingResponse(
+            content,
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f"attachment; filename=tasks.{format}"},
+        )
+
+    except Exception as e:
+        return JSONResponse(
+                status_code=500,
+                content=dict(ResponseBody[Any](
+                    code=500,
+                    message="Error in server! Please try again later",
+                    status=False,
+                    body=str(e),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+@router.get(
+    "/{task_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[TaskOUT],
+    responses = {
+        401: RESPONSE_401,
+        404: RESPONSE_404_USER,
+        500: RESPONSE_500,
+    }
+)
+async def get_task(
+    task_id: int,
+    if_none_match: str | None = Header(None),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_read_provider_dependency),
+    principal: Principal = Depends(get_principal),
+):
+    try:
+        user_id: Final[int] = principal.user_id
+
         if task_id <= 0 or task_id is None:
             return JSONResponse(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -347,8 +480,8 @@ def get_task(
                     ))
                 )
 
-        task: Final[TaskEntity | None] = task_service.get_by_id(task_id)
-        if task is None:
+        found: Final[tuple[TaskOUT, str] | None] = await task_service.get_with_etag_by_id_user_id(task_id, user_id)
+        if found is None:
             return JSONResponse(
                     status_code=status.HTTP_404_NOT_FOUND,
                     content=dict(ResponseBody[None](
@@ -360,22 +493,13 @@ def get_task(
                     ))
                 )
 
-        if user_id != task.user_id:
-            return JSONResponse(
-                status_code=409,
-                content=dict(ResponseBody[None](
-                    code=409,
-                    message="You are not authorized to read this task",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
-
-        task_out: Final[TaskOUT] = task.to_task_out()
+        task_out, etag = found
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
         return JSONResponse(
                 status_code=status.HTTP_200_OK,
+                headers={"ETag": etag},
                 content=dict(ResponseBody[dict](
                     code=status.HTTP_200_OK,
                     message="Task found with successfully",
@@ -400,52 +524,84 @@ def get_task(
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=Page[TaskOUT],
+    response_model=Page[TaskOUT] | TaskCursorPage,
+    description="Offset pagination by default, with paging=cursor the body is a TaskCursorPage",
+    # the union hides the Page from fastapi_pagination, so its page and size params are declared here
+    dependencies=[Depends(pagination_ctx(Page[TaskOUT]))],
     responses = {
         401: RESPONSE_401,
         404: RESPONSE_404_USER,
         500: RESPONSE_500,
     }
 )
-def get_all(
+async def get_all(
+    request: Request,
+    response: Response,
     task_filter: TaskFilter = Depends(),
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
-    task_service: TaskServiceProvider = Depends(get_task_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    cursor_params: TaskCursorParams = Depends(),
+    q: str | None = Query(None, max_length=200, description="Full-text search on title and description, results are ranked by relevance."),
+    if_none_match: str | None = Header(None),
+    user_service: AsyncUserServiceProvider = Depends(get_user_read_provider_dependency),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_read_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
+        user_id: Final[int] = principal.user_id
 
-        user_id: Final[int | None] = jwt_service.extract_user_id(token)
-        if user_id is None:
+        if not await user_service.exists_by_id(user_id):
             return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
+                status_code=status.HTTP_404_NOT_FOUND,
                 content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
+                    code=status.HTTP_404_NOT_FOUND,
+                    message="User not found",
                     status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
-        user: Final[UserEntity | None] = user_service.get_by_id(user_id)
-        if user is None:
+        list_etag: Final[str] = await task_service.get_list_etag(user_id, str(request.url.query))
+
+        if etag_matches(if_none_match, list_etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": list_etag})
+
+        if cursor_params.paging == "cursor" and q:
             return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=status.HTTP_400_BAD_REQUEST,
                 content=dict(ResponseBody[None](
-                    code=status.HTTP_404_NOT_FOUND,
-                    message="User not found",
+                    code=status.HTTP_400_BAD_REQUEST,
+                    message="Search is not supported in cursor mode",
                     status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
-        tasks: Final = task_service.get_all_user_id_filtered(user_id, task_filter)
+        if cursor_params.paging == "cursor":
+            cursor: Final[TaskCursor | None] = decode_task_cursor(cursor_params.cursor) if cursor_params.cursor else None
+
+            if cursor_params.cursor and (cursor is None or cursor.sort_by != cursor_params.sort_by):
+                return JSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content=dict(ResponseBody[None](
+                        code=status.HTTP_400_BAD_REQUEST,
+                        message="Cursor invalid",
+                        status=False,
+                        body=None,
+                        datetime = str(datetime.now())
+                    ))
+                )
+
+            cursor_page: Final[TaskCursorPage] = await task_service.get_cursor_page_user_id_filtered(
+                user_id, task_filter, cursor_params.sort_by, resolve_params().size, cursor
+            )
+
+            return JSONResponse(status_code=status.HTTP_200_OK, headers={"ETag": list_etag}, content=cursor_page.model_dump(mode="json"))
 
-        return paginate(tasks)
+        page: Final[Page[TaskOUT]] = await task_service.get_page_user_id_filtered(user_id, task_filter, q)
+        response.headers["ETag"] = list_etag
+
+        return page
 
     except Exception as e:
         return JSONResponse(
@@ -469,31 +625,76 @@ def get_all(
         500: RESPONSE_500,
     }
 )
-def create(
+async def create(
     dto: CreateTaskDTO,
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
-    task_service: TaskServiceProvider = Depends(get_task_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
+        user_id: Final[int] = principal.user_id
 
-        user_id: Final[int | None] = jwt_service.extract_user_id(token)
-        if user_id is None:
+        if not await user_service.exists_by_id(user_id):
             return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
+                status_code=status.HTTP_404_NOT_FOUND,
                 content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
+                    code=status.HTTP_404_NOT_FOUND,
+                    message="User not found",
                     status=False,
                     body=None,
                     datetime = str(datetime.now())
                 ))
             )
 
-        user: Final[UserEntity | None] = user_service.get_by_id(user_id)
-        if user is None:
+        task: Final = await task_service.create(user_id, dto)
+
+        task_mapped: Final[TaskOUT] = task.to_task_out()
+
+        return JSONResponse(
+                status_code=status.HTTP_201_CREATED,
+                content=dict(ResponseBody[dict](
+                    code=status.HTTP_201_CREATED,
+                    message="Task created with successfully",
+                    status=True,
+                    body=dict(task_mapped),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+    except Exception as e:
+        return JSONResponse(
+                status_code=500,
+                content=dict(ResponseBody[Any](
+                    code=500,
+                    message="Error in server! Please try again later",
+                    status=False,
+                    body=str(e),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ResponseBody[TaskBatchOUT],
+    description="Creates up to 1000 tasks in one transaction, invalid items are reported by index and skipped",
+    responses = {
+        401: RESPONSE_401,
+        404: RESPONSE_404_USER,
+        422: { "model": ResponseBody[TaskBatchOUT], "description": "No item is valid" },
+        500: RESPONSE_500,
+    }
+)
+async def create_batch(
+    items: list[dict[str, Any]] = Body(..., min_length=1, max_length=1000),
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
+):
+    try:
+        user_id: Final[int] = principal.user_id
+
+        if not await user_service.exists_by_id(user_id):
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content=dict(ResponseBody[None](
@@ -505,17 +706,94 @@ def create(
                 ))
             )
 
-        task: Final = task_service.create(user, dto)
+        dtos: Final[list[CreateTaskDTO]] = []
+        errors: Final[list[TaskBatchErrorOUT]] = []
 
-        task_mapped: Final[TaskOUT] = task.to_task_out()
+        for index, item in enumerate(items):
+            try:
+                dtos.append(CreateTaskDTO.model_validate(item))
+            except ValidationError as error:
+                errors.append(TaskBatchErrorOUT(index=index, errors=json.loads(error.json(include_url=False, include_input=False))))
+
+        created: Final[list[TaskOUT]] = await task_service.create_many(user_id, dtos)
+        code: Final[int] = status.HTTP_201_CREATED if len(created) > 0 else 422
 
         return JSONResponse(
-                status_code=status.HTTP_201_CREATED,
+                status_code=code,
                 content=dict(ResponseBody[dict](
-                    code=status.HTTP_201_CREATED,
-                    message="Task created with successfully",
+                    code=code,
+                    message="Tasks created with successfully" if len(errors) == 0 else f"{len(created)} tasks created, {len(errors)} invalid",
+                    status=len(errors) == 0,
+                    body=TaskBatchOUT(created=created, errors=errors).model_dump(mode="json"),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+    except Exception as e:
+        return JSONResponse(
+                status_code=500,
+                content=dict(ResponseBody[Any](
+                    code=500,
+                    message="Error in server! Please try again later",
+                    status=False,
+                    body=str(e),
+                    datetime = str(datetime.now())
+                ))
+            )
+
+@router.patch(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBody[list[TaskOUT]],
+    description="Applies the patch to the given ids, or to every task matching the filter, with one UPDATE",
+    responses = {
+        401: RESPONSE_401,
+        500: RESPONSE_500,
+    }
+)
+async def update_batch(
+    dto: BulkUpdateTaskDTO,
+    task_filter: TaskFilter = Depends(),
+    task_service: AsyncTaskServiceProvider = Depends(get_task_provider_dependency),
+    principal: Principal = Depends(get_principal),
+):
+    try:
+        user_id: Final[int] = principal.user_id
+
+        patch_fields: Final[set[str]] = dto.patch.model_fields_set
+        if (len(patch_fields) == 0 and not dto.toggle_is_done) or (dto.toggle_is_done and "is_done" in patch_fields):
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content=dict(ResponseBody[None](
+                    code=status.HTTP_400_BAD_REQUEST,
+                    message="Send a patch or toggle_is_done, but not is_done with toggle_is_done",
+                    status=False,
+                    body=None,
+                    datetime = str(datetime.now())
+                ))
+            )
+
+        if dto.ids is None and len(task_filter.model_dump(exclude_none=True)) == 0:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content=dict(ResponseBody[None](
+                    code=status.HTTP_400_BAD_REQUEST,
+                    message="Send ids or at least one filter",
+                    status=False,
+                    body=None,
+                    datetime = str(datetime.now())
+                ))
+            )
+
+        tasks: Final[list[TaskOUT]] = await task_service.update_many(user_id, task_filter, dto)
+
+        return JSONResponse(
+                status_code=status.HTTP_200_OK,
+                content=dict(ResponseBody[list](
+                    code=status.HTTP_200_OK,
+                    message=f"{len(tasks)} tasks updated with successfully",
                     status=True,
-                    body=dict(task_mapped),
+                    body=[task.model_dump(mode="json") for task in tasks],
                     datetime = str(datetime.now())
                 ))
             )
@@ -532,4 +810,4 @@ def create(
                 ))
             )
 
-add_pagination(router)
\ No newline at end of file
+add_pagination(router)
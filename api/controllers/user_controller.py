@@ -1,19 +1,17 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from api.models.entities.user_entity import UserEntity
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Final, Any
 from api.utils.res.response_body import ResponseBody
 from api.utils.res.responses_http import *
-from api.models.schemas.user_schemas import UserOUT, UpdateUserDTO
-from api.services.providers.provider_user_service import UserServiceProvider
+from api.models.schemas.user_schemas import UserOUT, UpdateUserDTO, Principal
+from api.services.providers.provider_async_user_service import AsyncUserServiceProvider
 from api.dependencies.service_dependency import *
+from api.configs.crypto.password_pool import PasswordPoolFullError
 from datetime import datetime
 
 router: Final[APIRouter] = APIRouter(prefix="/api/v1/user", tags=["User"])
 
-bearer_scheme: Final[HTTPBearer] = HTTPBearer()
-
 @router.put(
     "",
     description="Endpoint to update user",
@@ -23,32 +21,19 @@ bearer_scheme: Final[HTTPBearer] = HTTPBearer()
         401: RESPONSE_401,
         404: RESPONSE_404_USER,
         500: RESPONSE_500,
+        503: RESPONSE_503_PASSWORD,
     },
 )
-def update(
+async def update(
     dto: UpdateUserDTO,
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
+    principal: Principal = Depends(get_principal),
     ):
     
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
+        user_id: Final[int] = principal.user_id
 
-        user_id: Final[int | None] = jwt_service.extract_user_id(token)
-        if user_id is None:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
-
-        user: Final[UserEntity | None] = user_service.get_by_id(user_id)
+        user: Final[UserEntity | None] = await user_service.get_by_id(user_id)
         if user is None:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -61,7 +46,7 @@ def update(
                 ))
             )
 
-        user_updated: Final[UserEntity] = user_service.update(user,dto)
+        user_updated: Final[UserEntity] = await user_service.update(user,dto)
 
         user_out: Final[UserOUT] = user_updated.to_user_out()
 
@@ -76,6 +61,9 @@ def update(
                 ))
             )        
 
+    except PasswordPoolFullError:
+        raise
+
     except Exception as e:
         return JSONResponse(
                 status_code=500,
@@ -98,28 +86,15 @@ def update(
         500: RESPONSE_500,
     }
 )
-def delete(
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
+async def delete(
+    user_service: AsyncUserServiceProvider = Depends(get_user_provider_dependency),
     jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
+        user_id: Final[int] = principal.user_id
 
-        user_id: Final[int | None] = jwt_service.extract_user_id(token)
-        if user_id is None:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
-
-        user: Final[UserEntity | None] = user_service.get_by_id(user_id)
+        user: Final[UserEntity | None] = await user_service.get_by_id(user_id)
         if user is None:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -132,8 +107,9 @@ def delete(
                 ))
             )
 
-        user_service.delete(user)
-        
+        await user_service.delete(user)
+        jwt_service.invalidate_user_tokens(user_id)
+
         return JSONResponse(
                 status_code=status.HTTP_200_OK,
                 content=dict(ResponseBody[None](
@@ -167,28 +143,14 @@ def delete(
         500: RESPONSE_500,
     }
 )
-def get_me(
-    user_service: UserServiceProvider = Depends(get_user_provider_dependency),
-    jwt_service: BaseJwtService = Depends(get_jwt_service),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+async def get_me(
+    user_service: AsyncUserServiceProvider = Depends(get_user_read_provider_dependency),
+    principal: Principal = Depends(get_principal),
 ):
     try:
-        token: Final[str] = jwt_service.valid_credentials(credentials)
-
-        user_id: Final[int | None] = jwt_service.extract_user_id(token)
-        if user_id is None:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content=dict(ResponseBody[None](
-                    code=status.HTTP_401_UNAUTHORIZED,
-                    message="You are not authorized",
-                    status=False,
-                    body=None,
-                    datetime = str(datetime.now())
-                ))
-            )
+        user_id: Final[int] = principal.user_id
 
-        user: Final[UserEntity | None] = user_service.get_by_id(user_id)
+        user: Final[UserEntity | None] = await user_service.get_by_id(user_id)
         if user is None:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1,21 +1,100 @@
 from sqlalchemy.orm import Session
-from fastapi import Depends
-from api.configs.db.database import get_db
-from api.repositories.providers.provider_user_repository import UserRepositoryProvider
-from api.services.providers.provider_user_service import UserServiceProvider
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Request, status
+from fastapi.responses import JSONResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from api.configs.db.database import get_session, get_replica_session, recent_writes
+from api.configs.db.unit_of_work import UnitOfWork
+from api.services.providers.provider_async_user_service import AsyncUserServiceProvider
 from api.services.providers.provider_jwt_service import JwtServiceProvider
-from api.repositories.providers.provider_task_repository import TaskRepositoryProvider
-from api.services.providers.provider_task_service import TaskServiceProvider
+from api.services.providers.provider_async_task_service import AsyncTaskServiceProvider
 from api.services.base.base_jwt_service import BaseJwtService
-from typing import Final
+from api.models.schemas.user_schemas import Principal
+from api.utils.res.response_body import ResponseBody
+from datetime import datetime
+from typing import AsyncIterator, Final
 
-def get_user_provider_dependency(db: Session = Depends(get_db)) -> UserServiceProvider:
-    repository: Final = UserRepositoryProvider(db)
-    return UserServiceProvider(repository)
+optional_bearer_scheme: Final[HTTPBearer] = HTTPBearer(auto_error=False)
 
 def get_jwt_service() -> BaseJwtService:
     return JwtServiceProvider()
 
-def get_task_provider_dependency(db: Session = Depends(get_db)) -> TaskServiceProvider:
-    repository: Final[TaskRepositoryProvider] = TaskRepositoryProvider(db)
-    return TaskServiceProvider(repository)
\ No newline at end of file
+class NotAuthorizedError(Exception):
+    pass
+
+async def not_authorized_handler(request: Request, exc: NotAuthorizedError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content=dict(ResponseBody[None](
+            code=status.HTTP_401_UNAUTHORIZED,
+            message="You are not authorized",
+            status=False,
+            body=None,
+            datetime = str(datetime.now())
+        ))
+    )
+
+def get_optional_principal(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_bearer_scheme),
+    jwt_service: BaseJwtService = Depends(get_jwt_service),
+) -> Principal | None:
+    # the token is verified once per request, whichever dependency asks first
+    if hasattr(request.state, "principal"):
+        return request.state.principal
+
+    principal: Final[Principal | None] = (
+        jwt_service.principal_from_token(credentials.credentials) if credentials is not None else None
+    )
+    request.state.principal = principal
+
+    return principal
+
+def get_principal(principal: Principal | None = Depends(get_optional_principal)) -> Principal:
+    if principal is None:
+        raise NotAuthorizedError()
+
+    return principal
+
+def get_refresh_principal(refresh_token: str, jwt_service: BaseJwtService = Depends(get_jwt_service)) -> Principal:
+    principal: Final[Principal | None] = jwt_service.principal_from_token(refresh_token)
+    if principal is None:
+        raise NotAuthorizedError()
+
+    return principal
+
+def get_token_user_id(principal: Principal | None = Depends(get_optional_principal)) -> int | None:
+    return principal.user_id if principal is not None else None
+
+async def get_write_session(
+    db: Session | AsyncSession = Depends(get_session),
+    user_id: int | None = Depends(get_token_user_id),
+) -> AsyncIterator[Session | AsyncSession]:
+    # the commit hook in api/configs/db/replica.py opens the read-your-writes window for this user
+    db.info["user_id"] = user_id
+
+    # depended on with scope="function", so the commit happens before the response is sent
+    async with UnitOfWork(db):
+        yield db
+
+def get_read_session(
+    db: Session | AsyncSession = Depends(get_write_session, scope="function"),
+    replica: Session | AsyncSession | None = Depends(get_replica_session),
+    user_id: int | None = Depends(get_token_user_id),
+) -> Session | AsyncSession:
+    if replica is None or user_id is None or recent_writes.is_recent(user_id):
+        return db
+
+    return replica
+
+def get_user_provider_dependency(db: Session | AsyncSession = Depends(get_write_session, scope="function")) -> AsyncUserServiceProvider:
+    return AsyncUserServiceProvider(db)
+
+def get_task_provider_dependency(db: Session | AsyncSession = Depends(get_write_session, scope="function")) -> AsyncTaskServiceProvider:
+    return AsyncTaskServiceProvider(db)
+
+def get_user_read_provider_dependency(db: Session | AsyncSession = Depends(get_read_session)) -> AsyncUserServiceProvider:
+    return AsyncUserServiceProvider(db)
+
+def get_task_read_provider_dependency(db: Session | AsyncSession = Depends(get_read_session)) -> AsyncTaskServiceProvider:
+    return AsyncTaskServiceProvider(db)
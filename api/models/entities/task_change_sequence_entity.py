@@ -0,0 +1,11 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from api.configs.db.database import Base
+
+# one row per user, bumped by every task write and locked until its commit, so the values handed
+# out are committed in order and the change feed can seek on them
+class TaskChangeSequenceEntity(Base):
+    __tablename__ = "task_change_sequences"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    last_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,17 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from api.configs.db.database import Base
+
+# priority 0 holds the tasks without priority, so the key can stay a plain primary key;
+# the DTOs only accept priorities from 1 to 10, so no task can land in it by value
+NO_PRIORITY: int = 0
+
+class TaskCounterEntity(Base):
+    __tablename__ = "task_counters"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    priority: Mapped[int] = mapped_column(Integer, primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    dated_pending: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
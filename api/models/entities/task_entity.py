@@ -1,8 +1,9 @@
 from datetime import datetime, date
 from typing import Text
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, func, Text
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, func, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from api.configs.db.database import Base
+from api.configs.db.database import Base, TimestampTZ
+from api.configs.db.task_search import register_task_search
 
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,15 @@ if TYPE_CHECKING:
     from api.models.entities.user_entity import UserEntity
 class TaskEntity(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_id_user_id", "id", "user_id"),
+        Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_id_due_date_id", "user_id", "due_date", "id"),
+        Index("ix_tasks_user_id_is_done_due_date", "user_id", "is_done", "due_date"),
+        Index("ix_tasks_user_id_priority", "user_id", "priority"),
+        Index("ix_tasks_user_id_updated_at", "user_id", "updated_at"),
+        Index("ix_tasks_user_id_change_seq_id", "user_id", "change_seq", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -20,8 +30,9 @@ class TaskEntity(Base):
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at: Mapped[datetime] = mapped_column(TimestampTZ, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(TimestampTZ, server_default=func.now(), onupdate=func.now())
+    change_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     owner: Mapped["UserEntity"] = relationship("UserEntity", back_populates="tasks")
 
@@ -38,4 +49,37 @@ class TaskEntity(Base):
             user_id = self.user_id,
             created_at = str(self.created_at),
             updated_at = str(self.updated_at),
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def task_out_columns(cls) -> tuple:
+        return (
+            cls.id,
+            cls.title,
+            cls.description,
+            cls.is_done,
+            cls.due_date,
+            cls.priority,
+            cls.user_id,
+            cls.created_at,
+            cls.updated_at,
+        )
+
+    @staticmethod
+    def row_to_task_out(row):
+        from api.models.schemas.task_schemas import TaskOUT
+
+        # rows come straight from the typed columns, so validation is left to the response model
+        return TaskOUT.model_construct(
+            id = row.id,
+            title = row.title,
+            description = row.description,
+            is_done = row.is_done,
+            due_date = str(row.due_date),
+            priority = row.priority,
+            user_id = row.user_id,
+            created_at = str(row.created_at),
+            updated_at = str(row.updated_at),
+        )
+
+register_task_search(TaskEntity.__table__)
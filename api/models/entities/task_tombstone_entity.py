@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import ForeignKey, Index, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+from api.configs.db.database import Base, TimestampTZ
+
+class TaskTombstoneEntity(Base):
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_user_id_change_seq_id", "user_id", "change_seq", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    task_id: Mapped[int] = mapped_column(nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(TimestampTZ, server_default=func.now(), nullable=False)
+    change_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
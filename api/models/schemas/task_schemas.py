@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, EmailStr
 from datetime import datetime, date
+from typing import Literal, Any
 
 class TaskOUT(BaseModel):
     id: int
@@ -15,6 +16,41 @@ class TaskOUT(BaseModel):
     class Config:
         from_attributes = True
 
+class TaskCursorPage(BaseModel):
+    items: list[TaskOUT]
+    size: int
+    next_cursor: str | None
+    previous_cursor: str | None
+
+class TaskStatsOUT(BaseModel):
+    total: int
+    done: int
+    pending: int
+    overdue: int
+    by_priority: dict[int, int]
+
+class TaskChangeOUT(BaseModel):
+    type: Literal["upsert", "delete"]
+    task_id: int
+    changed_at: str
+    task: TaskOUT | None
+
+class TaskChangesOUT(BaseModel):
+    changes: list[TaskChangeOUT]
+    next_cursor: str
+    has_more: bool
+
+class TaskBatchErrorOUT(BaseModel):
+    index: int
+    errors: list[dict[str, Any]]
+
+class TaskBatchOUT(BaseModel):
+    created: list[TaskOUT]
+    errors: list[TaskBatchErrorOUT]
+
+class TaskBulkDeleteOUT(BaseModel):
+    deleted: int
+
 class CreateTaskDTO(BaseModel):
     title: str = Field(
         ...,
@@ -82,8 +118,25 @@ class UpdateTaskDTO(BaseModel):
 
     priority: int | None = Field(
         None,
+        ge=1,
         le=10,
         description="The priority field must be an integer between 1 and 10."
     )
 
-    
\ No newline at end of file
+class BulkUpdateTaskDTO(BaseModel):
+    ids: list[int] | None = Field(
+        None,
+        min_length=1,
+        max_length=1000,
+        description="Ids of the tasks to change, when omitted every task matching the filter is changed."
+    )
+
+    patch: UpdateTaskDTO = Field(
+        default_factory=UpdateTaskDTO,
+        description="Fields applied to every selected task."
+    )
+
+    toggle_is_done: bool = Field(
+        False,
+        description="Flips is_done on every selected task."
+    )
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+from datetime import datetime
 from api.models.entities.user_entity import UserEntity
 
 class CreateUserDTO(BaseModel):
@@ -24,4 +25,11 @@ class LoginDTO(BaseModel):
 class UserOUT(BaseModel):
     id: int
     name: str
-    email: str
\ No newline at end of file
+    email: str
+
+class Principal(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    user_id: int
+    email: str
+    exp: datetime
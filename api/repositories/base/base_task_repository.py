@@ -1,19 +1,84 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
+from sqlalchemy import Row
 from api.models.entities.task_entity import TaskEntity
 from api.utils.filters.task_filter import TaskFilter
+from api.models.schemas.task_schemas import TaskOUT, TaskCursorPage, TaskStatsOUT, TaskChangesOUT
+from api.utils.pagination.task_cursor import TaskCursor, TaskSortKey, TaskChangesCursor
+from fastapi_pagination import Page
 
 class BaseTaskRepository(ABC):
 
     @abstractmethod
     def get_by_id(self, id: int) -> TaskEntity | None:
         pass
+
+    @abstractmethod
+    def get_by_id_user_id(self, id: int, user_id: int) -> TaskEntity | None:
+        pass
     
     @abstractmethod
     def get_all_user_id_filtered(self, user_id: int, filters: TaskFilter) -> list[TaskEntity]: 
         pass
 
     @abstractmethod
-    def delete(self, task: TaskEntity):
+    def get_page_user_id_filtered(self, user_id: int, filters: TaskFilter, q: str | None = None) -> Page[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def stream_user_id_filtered(self, user_id: int, filters: TaskFilter) -> Iterator[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def get_changes_user_id(self, user_id: int, since: TaskChangesCursor | None, limit: int) -> TaskChangesOUT:
+        pass
+
+    @abstractmethod
+    def get_stats_user_id_filtered(self, user_id: int, filters: TaskFilter) -> TaskStatsOUT:
+        pass
+
+    @abstractmethod
+    def get_cursor_page_user_id_filtered(self, user_id: int, filters: TaskFilter, sort_by: TaskSortKey, size: int, cursor: TaskCursor | None) -> TaskCursorPage:
+        pass
+
+    @abstractmethod
+    def next_change_seq(self, user_id: int) -> int:
+        pass
+
+    @abstractmethod
+    def apply_counter_delta(self, user_id: int, priority: int, total: int, done: int, dated_pending: int, revision: int = 0):
+        pass
+
+    @abstractmethod
+    def get_with_revision_by_id_user_id(self, id: int, user_id: int) -> Row | None:
+        pass
+
+    @abstractmethod
+    def get_watermark_user_id(self, user_id: int) -> Row:
+        pass
+
+    @abstractmethod
+    def rebuild_counters(self, user_id: int | None = None):
+        pass
+
+    @abstractmethod
+    def create_many(self, tasks: list[dict]) -> list[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def update_many_user_id(self, user_id: int, ids: list[int] | None, filters: TaskFilter, values: dict, toggle_is_done: bool) -> tuple[list[Row], list[Row]]:
+        pass
+
+    @abstractmethod
+    def get_counter_state_by_id_user_id(self, id: int, user_id: int) -> Row | None:
+        pass
+
+    @abstractmethod
+    def update_by_id_user_id(self, id: int, user_id: int, values: dict, toggle_is_done: bool) -> Row | None:
+        pass
+
+    @abstractmethod
+    def delete_many_user_id(self, user_id: int, ids: list[int] | None, filters: TaskFilter, change_seq: int = 0) -> list[Row]:
         pass
 
     @abstractmethod
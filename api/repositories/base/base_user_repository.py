@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 from api.models.entities.user_entity import UserEntity
 
 class BaseUserRepository(ABC):
@@ -14,6 +15,10 @@ class BaseUserRepository(ABC):
     def get_by_id(self, id: int) -> (UserEntity | None):
         pass
 
+    @abstractmethod
+    def exists_by_id(self, id: int) -> bool:
+        pass
+
     @abstractmethod
     def create(self, user: UserEntity) -> UserEntity:
         pass
@@ -32,4 +37,8 @@ class BaseUserRepository(ABC):
 
     @abstractmethod
     def save(self, user: UserEntity) -> UserEntity:
+        pass
+
+    @abstractmethod
+    def savepoint(self) -> AbstractContextManager:
         pass
\ No newline at end of file
@@ -1,9 +1,20 @@
 from api.repositories.base.base_task_repository import BaseTaskRepository
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, date
 from api.models.entities.task_entity import TaskEntity
+from api.models.entities.task_counter_entity import TaskCounterEntity, NO_PRIORITY
+from api.models.entities.task_tombstone_entity import TaskTombstoneEntity
+from api.models.entities.task_change_sequence_entity import TaskChangeSequenceEntity
+from sqlalchemy.dialects import postgresql, sqlite
 from api.utils.filters.task_filter import TaskFilter
-from sqlalchemy import select
+from sqlalchemy import select, update, not_, or_, and_, ColumnElement, func, case, delete, insert, Row, lambda_stmt
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate
+from api.models.schemas.task_schemas import TaskOUT, TaskCursorPage, TaskStatsOUT, TaskChangesOUT, TaskChangeOUT
+from api.utils.pagination.task_cursor import TaskCursor, TaskSortKey, TaskChangesCursor, encode_task_cursor, encode_task_changes_cursor
+from typing import Final, Iterator
+from api.configs.db.task_search import apply_task_search
 
 class TaskRepositoryProvider(BaseTaskRepository):
     def __init__(self, db: Session):
@@ -13,26 +24,416 @@ class TaskRepositoryProvider(BaseTaskRepository):
         stmt = select(TaskEntity).where(TaskEntity.id == id)
         return self.db.execute(stmt).scalar_one_or_none()
 
+    def get_by_id_user_id(self, id: int, user_id: int) -> (TaskEntity | None):
+        stmt = select(TaskEntity).where(TaskEntity.id == id, TaskEntity.user_id == user_id)
+        return self.db.execute(stmt).scalar_one_or_none()
+
     def get_all_user_id_filtered(self, user_id: int, filters: TaskFilter) -> list[TaskEntity]: 
-        stmt = select(TaskEntity).where(TaskEntity.user_id == user_id)
-        stmt = filters.filter(stmt)
+        stmt = lambda_stmt(lambda: select(TaskEntity).where(TaskEntity.user_id == user_id))
+        stmt = filters.filter_lambda(stmt)
 
         results = self.db.execute(stmt).scalars().all()
         return list(results)
+
+    def get_page_user_id_filtered(self, user_id: int, filters: TaskFilter, q: str | None = None) -> Page[TaskOUT]:
+        if q:
+            stmt = select(*TaskEntity.task_out_columns()).where(TaskEntity.user_id == user_id)
+            stmt = apply_task_search(filters.filter(stmt), q, self.db.get_bind().dialect.name).order_by(TaskEntity.id)
+        else:
+            stmt = filters.filter_lambda(self._task_out_stmt(user_id))
+            stmt += lambda s: s.order_by(TaskEntity.created_at, TaskEntity.id)
+
+        count_stmt: Final = None if q or self._has_filters(filters) else self._counter_total_stmt(user_id)
+
+        return paginate(
+            self.db,
+            stmt,
+            count_query=count_stmt,
+            transformer=lambda rows: [TaskEntity.row_to_task_out(row) for row in rows],
+        )
+
+    def stream_user_id_filtered(self, user_id: int, filters: TaskFilter, batch_size: int = 1000) -> Iterator[TaskOUT]:
+        stmt = filters.filter_lambda(self._task_out_stmt(user_id))
+        stmt += lambda s: s.order_by(TaskEntity.created_at, TaskEntity.id)
+
+        result: Final = self.db.execute(stmt.execution_options(yield_per=batch_size))
+
+        try:
+            for row in result:
+                yield TaskEntity.row_to_task_out(row)
+        finally:
+            result.close()
+
+    def get_stats_user_id_filtered(self, user_id: int, filters: TaskFilter) -> TaskStatsOUT:
+        overdue: Final = and_(TaskEntity.is_done.is_(False), TaskEntity.due_date < date.today())
+
+        if not self._has_filters(filters):
+            return self._get_stats_from_counters(user_id, overdue)
+
+        stmt = select(
+            TaskEntity.priority,
+            func.count().label("total"),
+            func.coalesce(func.sum(case((TaskEntity.is_done.is_(True), 1), else_=0)), 0).label("done"),
+            func.coalesce(func.sum(case((overdue, 1), else_=0)), 0).label("overdue"),
+        ).where(TaskEntity.user_id == user_id)
+        stmt = filters.filter(stmt).group_by(TaskEntity.priority)
+
+        rows: Final = self.db.execute(stmt).all()
+        total: Final[int] = sum(row.total for row in rows)
+        done: Final[int] = sum(row.done for row in rows)
+
+        return TaskStatsOUT(
+            total = total,
+            done = done,
+            pending = total - done,
+            overdue = sum(row.overdue for row in rows),
+            by_priority = {row.priority: row.total for row in rows if row.priority is not None},
+        )
+
+    def _upsert_insert(self):
+        dialect: Final[str] = self.db.get_bind().dialect.name
+
+        if dialect not in ("postgresql", "sqlite"):
+            raise ValueError(f"Task counters and change sequences are not supported on {dialect}")
+
+        return postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    def next_change_seq(self, user_id: int) -> int:
+        # the upserted row stays locked until the commit, so a later value can't commit before an earlier one
+        stmt = self._upsert_insert()(TaskChangeSequenceEntity).values(user_id=user_id, last_seq=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TaskChangeSequenceEntity.user_id],
+            set_=dict(last_seq=TaskChangeSequenceEntity.last_seq + 1),
+        ).returning(TaskChangeSequenceEntity.last_seq)
+
+        return self.db.execute(stmt).scalar_one()
+
+    def _counter_delta_stmt(self):
+        stmt = self._upsert_insert()(TaskCounterEntity)
+
+        return stmt.on_conflict_do_update(
+            index_elements=[TaskCounterEntity.user_id, TaskCounterEntity.priority],
+            set_=dict(
+                total=TaskCounterEntity.total + stmt.excluded.total,
+                done=TaskCounterEntity.done + stmt.excluded.done,
+                dated_pending=TaskCounterEntity.dated_pending + stmt.excluded.dated_pending,
+                revision=TaskCounterEntity.revision + stmt.excluded.revision,
+            ),
+        )
+
+    def apply_counter_delta(self, user_id: int, priority: int, total: int, done: int, dated_pending: int, revision: int = 0):
+        values: Final = dict(user_id=user_id, priority=priority, total=total, done=done, dated_pending=dated_pending, revision=revision)
+
+        self.db.execute(self._counter_delta_stmt(), [values])
+
+    def get_with_revision_by_id_user_id(self, id: int, user_id: int) -> Row | None:
+        revision: Final = (
+            select(func.coalesce(func.sum(TaskCounterEntity.revision), 0))
+            .where(TaskCounterEntity.user_id == TaskEntity.user_id)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(*TaskEntity.task_out_columns(), revision.label("revision"))
+            .where(TaskEntity.id == id, TaskEntity.user_id == user_id)
+        )
+
+        return self.db.execute(stmt).one_or_none()
+
+    def get_watermark_user_id(self, user_id: int) -> Row:
+        updated_at: Final = select(func.max(TaskEntity.updated_at)).where(TaskEntity.user_id == user_id).scalar_subquery()
+        stmt = select(
+            func.coalesce(func.sum(TaskCounterEntity.revision), 0).label("revision"),
+            func.coalesce(func.sum(TaskCounterEntity.total), 0).label("total"),
+            updated_at.label("updated_at"),
+        ).where(TaskCounterEntity.user_id == user_id)
+
+        return self.db.execute(stmt).one()
+
+    def rebuild_counters(self, user_id: int | None = None):
+        priority: Final = func.coalesce(TaskEntity.priority, NO_PRIORITY)
+
+        counted = select(
+            TaskEntity.user_id,
+            priority,
+            func.count(),
+            func.sum(case((TaskEntity.is_done.is_(True), 1), else_=0)),
+            func.sum(case((and_(TaskEntity.is_done.is_(False), TaskEntity.due_date.is_not(None)), 1), else_=0)),
+        ).group_by(TaskEntity.user_id, priority)
+        revisions = select(TaskCounterEntity.user_id, func.sum(TaskCounterEntity.revision)).group_by(TaskCounterEntity.user_id)
+        clear = delete(TaskCounterEntity)
+
+        # every task write takes its user's sequence row first, so holding it keeps writes out until the rebuild commits
+        if user_id is not None:
+            self.next_change_seq(user_id)
+            counted = counted.where(TaskEntity.user_id == user_id)
+            revisions = revisions.where(TaskCounterEntity.user_id == user_id)
+            clear = clear.where(TaskCounterEntity.user_id == user_id)
+        else:
+            self.db.execute(select(TaskChangeSequenceEntity.user_id).with_for_update()).all()
+
+        previous: Final = self.db.execute(revisions).all()
+
+        self.db.execute(clear)
+        self.db.execute(insert(TaskCounterEntity).from_select(
+            ["user_id", "priority", "total", "done", "dated_pending"], counted
+        ))
+
+        # list ETags carry sum(revision), which must only go up, or an ETag from before the rebuild could match again
+        if previous:
+            self.db.execute(self._counter_delta_stmt(), [
+                dict(user_id=row[0], priority=NO_PRIORITY, total=0, done=0, dated_pending=0, revision=(row[1] or 0) + 1)
+                for row in previous
+            ])
+
+    def _task_out_stmt(self, user_id: int) -> StatementLambdaElement:
+        return lambda_stmt(lambda: select(*TaskEntity.task_out_columns()).where(TaskEntity.user_id == user_id))
+
+    def _has_filters(self, filters: TaskFilter) -> bool:
+        return len(filters.model_dump(exclude_none=True)) > 0
+
+    def _counter_total_stmt(self, user_id: int):
+        return select(func.coalesce(func.sum(TaskCounterEntity.total), 0)).where(TaskCounterEntity.user_id == user_id)
+
+    def _get_stats_from_counters(self, user_id: int, overdue: ColumnElement[bool]) -> TaskStatsOUT:
+        counters: Final = self.db.execute(
+            select(TaskCounterEntity).where(TaskCounterEntity.user_id == user_id, TaskCounterEntity.total > 0)
+        ).scalars().all()
+
+        total: Final[int] = sum(counter.total for counter in counters)
+        done: Final[int] = sum(counter.done for counter in counters)
+        dated_pending: Final[int] = sum(counter.dated_pending for counter in counters)
+
+        overdue_count: Final[int] = 0 if dated_pending == 0 else self.db.execute(
+            select(func.count()).select_from(TaskEntity).where(TaskEntity.user_id == user_id, overdue)
+        ).scalar_one()
+
+        return TaskStatsOUT(
+            total = total,
+            done = done,
+            pending = total - done,
+            overdue = overdue_count,
+            by_priority = {counter.priority: counter.total for counter in counters if counter.priority != NO_PRIORITY},
+        )
+
+    def get_cursor_page_user_id_filtered(
+        self,
+        user_id: int,
+        filters: TaskFilter,
+        sort_by: TaskSortKey,
+        size: int,
+        cursor: TaskCursor | None,
+    ) -> TaskCursorPage:
+        column: Final = getattr(TaskEntity, sort_by)
+        backwards: Final[bool] = cursor is not None and cursor.backwards
+
+        limit: Final[int] = size + 1
+        stmt = filters.filter_lambda(self._task_out_stmt(user_id))
+
+        if cursor is not None:
+            seek: Final[ColumnElement[bool]] = self._seek_condition(column, cursor)
+            stmt += lambda s: s.where(seek)
+
+        if backwards:
+            stmt += lambda s: s.order_by(column.desc().nulls_first(), TaskEntity.id.desc()).limit(limit)
+        else:
+            stmt += lambda s: s.order_by(column.asc().nulls_last(), TaskEntity.id.asc()).limit(limit)
+
+        rows: Final[list] = list(self.db.execute(stmt).all())
+        has_more: Final[bool] = len(rows) > size
+        del rows[size:]
+
+        if backwards:
+            rows.reverse()
+
+        has_next: Final[bool] = len(rows) > 0 and (backwards or has_more)
+        has_previous: Final[bool] = len(rows) > 0 and (has_more if backwards else cursor is not None)
+
+        return TaskCursorPage(
+            items = [TaskEntity.row_to_task_out(row) for row in rows],
+            size = size,
+            next_cursor = self._cursor_for(rows[-1], sort_by, False) if has_next else None,
+            previous_cursor = self._cursor_for(rows[0], sort_by, True) if has_previous else None,
+        )
+
+    def _seek_condition(self, column, cursor: TaskCursor) -> ColumnElement[bool]:
+        key: Final = cursor.key_value()
+
+        if cursor.backwards:
+            if key is None:
+                return or_(column.is_not(None), TaskEntity.id < cursor.id)
+
+            return or_(column < key, and_(column == key, TaskEntity.id < cursor.id))
+
+        if key is None:
+            return and_(column.is_(None), TaskEntity.id > cursor.id)
+
+        return or_(column > key, and_(column == key, TaskEntity.id > cursor.id), column.is_(None))
+
+    def _cursor_for(self, row, sort_by: TaskSortKey, backwards: bool) -> str:
+        value: Final = getattr(row, sort_by)
+
+        return encode_task_cursor(TaskCursor(
+            sort_by = sort_by,
+            key = value.isoformat() if value is not None else None,
+            id = row.id,
+            backwards = backwards,
+        ))
     
-    def delete(self, task: TaskEntity):
-        self.db.delete(task)
-        self.db.commit()
-        
+    def get_changes_user_id(self, user_id: int, since: TaskChangesCursor | None, limit: int) -> TaskChangesOUT:
+        cursor: Final[TaskChangesCursor] = since if since is not None else self._initial_changes_cursor(user_id)
+
+        # seeking on the per-user change_seq, not on timestamps: those only have second precision on SQLite and
+        # are the transaction start on Postgres, so a write committed after a sync could sort before its cursor
+        tasks_stmt = (
+            select(*TaskEntity.task_out_columns(), TaskEntity.change_seq)
+            .where(TaskEntity.user_id == user_id)
+            .where(or_(
+                TaskEntity.change_seq > cursor.task_seq,
+                and_(TaskEntity.change_seq == cursor.task_seq, TaskEntity.id > cursor.task_id),
+            ))
+        )
+
+        tombstones_stmt = (
+            select(TaskTombstoneEntity)
+            .where(TaskTombstoneEntity.user_id == user_id)
+            .where(or_(
+                TaskTombstoneEntity.change_seq > cursor.tombstone_seq,
+                and_(TaskTombstoneEntity.change_seq == cursor.tombstone_seq, TaskTombstoneEntity.id > cursor.tombstone_id),
+            ))
+        )
+
+        tasks: Final = self.db.execute(tasks_stmt.order_by(TaskEntity.change_seq, TaskEntity.id).limit(limit + 1)).all()
+        tombstones: Final = self.db.execute(
+            tombstones_stmt.order_by(TaskTombstoneEntity.change_seq, TaskTombstoneEntity.id).limit(limit + 1)
+        ).scalars().all()
+
+        events: Final[list] = sorted(
+            [(row.change_seq, 0, row.id, row) for row in tasks] + [(row.change_seq, 1, row.id, row) for row in tombstones],
+            key=lambda event: event[:3],
+        )
+        has_more: Final[bool] = len(events) > limit
+        del events[limit:]
+
+        next_cursor: Final[TaskChangesCursor] = cursor.model_copy()
+        changes: Final[list[TaskChangeOUT]] = []
+
+        for change_seq, kind, _, row in events:
+            if kind == 0:
+                next_cursor.task_seq, next_cursor.task_id = change_seq, row.id
+                changes.append(TaskChangeOUT(type="upsert", task_id=row.id, changed_at=str(row.updated_at), task=TaskEntity.row_to_task_out(row)))
+            else:
+                next_cursor.tombstone_seq, next_cursor.tombstone_id = change_seq, row.id
+                changes.append(TaskChangeOUT(type="delete", task_id=row.task_id, changed_at=str(row.deleted_at), task=None))
+
+        return TaskChangesOUT(changes=changes, next_cursor=encode_task_changes_cursor(next_cursor), has_more=has_more)
+
+    def _initial_changes_cursor(self, user_id: int) -> TaskChangesCursor:
+        # a client without a cursor has no copy of deleted tasks, so it starts after the latest tombstone
+        latest: Final = self.db.execute(
+            select(TaskTombstoneEntity.change_seq, TaskTombstoneEntity.id)
+            .where(TaskTombstoneEntity.user_id == user_id)
+            .order_by(TaskTombstoneEntity.change_seq.desc(), TaskTombstoneEntity.id.desc())
+            .limit(1)
+        ).one_or_none()
+
+        if latest is None:
+            return TaskChangesCursor()
+
+        return TaskChangesCursor(tombstone_seq=latest.change_seq, tombstone_id=latest.id)
+
     def create(self, task: TaskEntity) -> TaskEntity:
         self.db.add(task)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(task)
 
         return task
 
+    def create_many(self, tasks: list[dict]) -> list[TaskOUT]:
+        stmt = insert(TaskEntity).returning(*TaskEntity.task_out_columns(), sort_by_parameter_order=True)
+        rows: Final = self.db.execute(stmt, tasks).all()
+
+        return [TaskEntity.row_to_task_out(row) for row in rows]
+
+    def update_many_user_id(
+        self,
+        user_id: int,
+        ids: list[int] | None,
+        filters: TaskFilter,
+        values: dict,
+        toggle_is_done: bool,
+    ) -> tuple[list[Row], list[Row]]:
+        selected = select(TaskEntity.id).where(TaskEntity.user_id == user_id)
+        if ids is not None:
+            selected = selected.where(TaskEntity.id.in_(ids))
+        selected = filters.filter(selected)
+
+        # the previous state is only needed for the counter deltas, and is locked so it can't drift before the update
+        before: Final = self.db.execute(
+            select(TaskEntity.id, TaskEntity.priority, TaskEntity.is_done, TaskEntity.due_date)
+            .where(TaskEntity.id.in_(selected))
+            .with_for_update()
+        ).all()
+
+        if len(before) == 0:
+            return [], []
+
+        if toggle_is_done:
+            values = dict(values, is_done=not_(TaskEntity.is_done))
+
+        stmt = (
+            update(TaskEntity)
+            .where(TaskEntity.user_id == user_id, TaskEntity.id.in_(selected))
+            .values(**values)
+            .returning(*TaskEntity.task_out_columns())
+        )
+
+        return list(before), list(self.db.execute(stmt).all())
+
+    def get_counter_state_by_id_user_id(self, id: int, user_id: int) -> Row | None:
+        stmt = (
+            select(TaskEntity.priority, TaskEntity.is_done, TaskEntity.due_date)
+            .where(TaskEntity.id == id, TaskEntity.user_id == user_id)
+            .with_for_update()
+        )
+
+        return self.db.execute(stmt).one_or_none()
+
+    def update_by_id_user_id(self, id: int, user_id: int, values: dict, toggle_is_done: bool) -> Row | None:
+        if toggle_is_done:
+            values = dict(values, is_done=not_(TaskEntity.is_done))
+
+        stmt = (
+            update(TaskEntity)
+            .where(TaskEntity.id == id, TaskEntity.user_id == user_id)
+            .values(**values)
+            .returning(*TaskEntity.task_out_columns())
+        )
+
+        return self.db.execute(stmt).one_or_none()
+
+    def delete_many_user_id(self, user_id: int, ids: list[int] | None, filters: TaskFilter, change_seq: int = 0) -> list[Row]:
+        selected = select(TaskEntity.id).where(TaskEntity.user_id == user_id)
+        if ids is not None:
+            selected = selected.where(TaskEntity.id.in_(ids))
+        selected = filters.filter(selected)
+
+        stmt = (
+            delete(TaskEntity)
+            .where(TaskEntity.user_id == user_id, TaskEntity.id.in_(selected))
+            .returning(TaskEntity.id, TaskEntity.priority, TaskEntity.is_done, TaskEntity.due_date)
+        )
+        deleted: Final[list[Row]] = list(self.db.execute(stmt).all())
+
+        if deleted:
+            self.db.execute(
+                insert(TaskTombstoneEntity),
+                [{"task_id": row.id, "user_id": user_id, "change_seq": change_seq} for row in deleted],
+            )
+
+        return deleted
+
     def save(self, task: TaskEntity) -> TaskEntity:
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(task)
 
         return task
@@ -2,6 +2,8 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from api.repositories.base.base_user_repository import BaseUserRepository
 from api.models.entities.user_entity import UserEntity
+from api.configs.db.unit_of_work import savepoint
+from sqlalchemy.orm import SessionTransaction
 
 class UserRepositoryProvider(BaseUserRepository):
     def __init__(self, db: Session):
@@ -15,35 +17,41 @@ class UserRepositoryProvider(BaseUserRepository):
 
     def get_by_id(self, id: int) -> (UserEntity | None):
         return self.db.query(UserEntity).filter(UserEntity.id == id).first()
+
+    def exists_by_id(self, id: int) -> bool:
+        return self.db.query(UserEntity.id).filter(UserEntity.id == id).first() is not None
     
     def create(self, user: UserEntity) -> UserEntity:
         self.db.add(user)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(user)
 
         return user
 
     def delete(self, user: UserEntity):
         self.db.delete(user)
-        self.db.commit()
+        self.db.flush()
 
     def refresh_token(self, refresh_token: str, user: UserEntity) -> UserEntity:
         user.refresh_token = refresh_token
 
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(user)
         return user
 
     def update(self, user) -> UserEntity:
         user.updated_at = datetime.now()
         self.db.add(user)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(user)
 
         return user
 
     def save(self, user: UserEntity) -> UserEntity:
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(user)
 
-        return user
\ No newline at end of file
+        return user
+
+    def savepoint(self) -> SessionTransaction:
+        return savepoint(self.db)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from api.models.entities.user_entity import UserEntity
+from api.models.schemas.user_schemas import Principal
 from fastapi.security import HTTPAuthorizationCredentials
 
 class BaseJwtService(ABC):
@@ -20,6 +21,14 @@ class BaseJwtService(ABC):
     def extract_user_id(self, token: str) -> int | None:
         pass
 
+    @abstractmethod
+    def principal_from_token(self, token: str) -> Principal | None:
+        pass
+
+    @abstractmethod
+    def invalidate_user_tokens(self, user_id: int):
+        pass
+
     @abstractmethod
     def extract_email(self, token: str) -> str | None:
         pass
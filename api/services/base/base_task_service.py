@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from api.models.entities.task_entity import TaskEntity
-from api.models.entities.user_entity import UserEntity
 from api.utils.filters.task_filter import TaskFilter
-from typing import List
-from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO
+from typing import List, Iterator
+from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO, TaskOUT, TaskCursorPage, TaskStatsOUT, TaskChangesOUT, BulkUpdateTaskDTO
+from api.utils.pagination.task_cursor import TaskCursor, TaskSortKey, TaskChangesCursor
+from fastapi_pagination import Page
 
 class BaseTaskService(ABC):
 
@@ -11,12 +12,40 @@ class BaseTaskService(ABC):
     def get_by_id(self, id: int) -> (TaskEntity | None):
         pass
 
+    @abstractmethod
+    def get_by_id_user_id(self, id: int, user_id: int) -> (TaskEntity | None):
+        pass
+
     @abstractmethod
     def delete(self, task: TaskEntity):
         pass
 
     @abstractmethod
-    def create(self, user: UserEntity, dto: CreateTaskDTO) -> TaskEntity:
+    def delete_by_id_user_id(self, id: int, user_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def create(self, user_id: int, dto: CreateTaskDTO) -> TaskEntity:
+        pass
+
+    @abstractmethod
+    def create_many(self, user_id: int, dtos: list[CreateTaskDTO]) -> list[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def update_many(self, user_id: int, filters: TaskFilter, dto: BulkUpdateTaskDTO) -> list[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def update_by_id_user_id(self, id: int, user_id: int, dto: UpdateTaskDTO) -> TaskOUT | None:
+        pass
+
+    @abstractmethod
+    def change_status_done_by_id_user_id(self, id: int, user_id: int) -> TaskOUT | None:
+        pass
+
+    @abstractmethod
+    def delete_many(self, user_id: int, ids: list[int] | None, filters: TaskFilter) -> list[int]:
         pass
 
     @abstractmethod
@@ -27,6 +56,34 @@ class BaseTaskService(ABC):
     def get_all_user_id_filtered(self, user_id: int, filters: TaskFilter) -> List[TaskEntity]: 
         pass
 
+    @abstractmethod
+    def get_page_user_id_filtered(self, user_id: int, filters: TaskFilter, q: str | None = None) -> Page[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def stream_user_id_filtered(self, user_id: int, filters: TaskFilter) -> Iterator[TaskOUT]:
+        pass
+
+    @abstractmethod
+    def get_with_etag_by_id_user_id(self, id: int, user_id: int) -> tuple[TaskOUT, str] | None:
+        pass
+
+    @abstractmethod
+    def get_list_etag(self, user_id: int, query: str) -> str:
+        pass
+
+    @abstractmethod
+    def get_changes_user_id(self, user_id: int, since: TaskChangesCursor | None, limit: int) -> TaskChangesOUT:
+        pass
+
+    @abstractmethod
+    def get_stats_user_id_filtered(self, user_id: int, filters: TaskFilter) -> TaskStatsOUT:
+        pass
+
+    @abstractmethod
+    def get_cursor_page_user_id_filtered(self, user_id: int, filters: TaskFilter, sort_by: TaskSortKey, size: int, cursor: TaskCursor | None) -> TaskCursorPage:
+        pass
+
     @abstractmethod
     def change_status_done(self, task: TaskEntity) -> TaskEntity:
         pass
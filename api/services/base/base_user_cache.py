@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+class BaseUserCache(ABC):
+
+    @abstractmethod
+    def contains(self, user_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def add(self, user_id: int):
+        pass
+
+    @abstractmethod
+    def invalidate(self, user_id: int):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
@@ -8,6 +8,10 @@ class BaseUserService(ABC):
     def get_by_id(self, id: int) -> UserEntity | None:
         pass
 
+    @abstractmethod
+    def exists_by_id(self, id: int) -> bool:
+        pass
+
     @abstractmethod
     def get_by_email(self, email: str) -> UserEntity | None:
         pass
@@ -15,17 +19,21 @@ class BaseUserService(ABC):
     @abstractmethod
     def set_refresh_token(self, refresh_token: str, user: UserEntity) -> UserEntity:
         pass
+
+    @abstractmethod
+    def set_password_hash(self, password_hash: str, user: UserEntity) -> UserEntity:
+        pass
     
     @abstractmethod
     def delete(self, user: UserEntity):
         pass
 
     @abstractmethod
-    def update(self, user: UserEntity, dto: UpdateUserDTO) -> UserEntity:
+    def update(self, user: UserEntity, dto: UpdateUserDTO, password_hash: str | None = None) -> UserEntity:
         pass
 
     @abstractmethod
-    def create(self, dto: CreateUserDTO) -> UserEntity:
+    def create(self, dto: CreateUserDTO, password_hash: str | None = None) -> UserEntity | None:
         pass
 
     @abstractmethod
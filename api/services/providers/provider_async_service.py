@@ -0,0 +1,50 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.configs.db.unit_of_work import has_writes
+from starlette.concurrency import run_in_threadpool
+from itertools import islice
+from typing import AsyncIterator, Callable, Final, Generic, Iterator, TypeVar
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+class AsyncServiceProvider(Generic[S]):
+    """Awaitable front for a sync service.
+
+    On an AsyncSession the service runs through run_sync, so its queries go over the async driver
+    on the event loop; on a Session it runs in the threadpool, as the sync endpoints did.
+    """
+
+    def __init__(self, db: Session | AsyncSession, factory: Callable[[Session], S]):
+        self.db = db
+        self.factory = factory
+
+    async def _run(self, call: Callable[[S], T], release: bool = True) -> T:
+        def run(session: Session) -> T:
+            try:
+                result: Final[T] = call(self.factory(session))
+            except Exception:
+                session.rollback()
+                raise
+
+            # a read-only transaction is ended, so the connection goes back to the pool between awaits
+            # instead of being held by a request that is waiting for the loop or a thread; one that
+            # wrote stays open until the request's unit of work commits it
+            if release and not has_writes(session):
+                session.commit()
+
+            return result
+
+        if isinstance(self.db, AsyncSession):
+            return await self.db.run_sync(run)
+
+        return await run_in_threadpool(run, self.db)
+
+    async def _stream(self, call: Callable[[S], Iterator[T]], chunk_size: int = 500) -> AsyncIterator[T]:
+        items: Final[Iterator[T]] = await self._run(call, release=False)
+
+        while chunk := await self._run(lambda _: list(islice(items, chunk_size)), release=False):
+            for item in chunk:
+                yield item
+
+        await self._run(lambda _: None)
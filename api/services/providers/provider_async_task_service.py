@@ -0,0 +1,66 @@
+from api.services.providers.provider_async_service import AsyncServiceProvider
+from api.services.providers.provider_task_service import TaskServiceProvider
+from api.repositories.providers.provider_task_repository import TaskRepositoryProvider
+from api.models.entities.task_entity import TaskEntity
+from api.utils.filters.task_filter import TaskFilter
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator
+from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO, TaskOUT, TaskCursorPage, TaskStatsOUT, TaskChangesOUT, BulkUpdateTaskDTO
+from api.utils.pagination.task_cursor import TaskCursor, TaskSortKey, TaskChangesCursor
+from fastapi_pagination import Page
+
+class AsyncTaskServiceProvider(AsyncServiceProvider[TaskServiceProvider]):
+    def __init__(self, db: Session | AsyncSession):
+        super().__init__(db, lambda session: TaskServiceProvider(TaskRepositoryProvider(session)))
+
+    async def get_by_id(self, id: int) -> (TaskEntity | None):
+        return await self._run(lambda service: service.get_by_id(id))
+
+    async def get_by_id_user_id(self, id: int, user_id: int) -> (TaskEntity | None):
+        return await self._run(lambda service: service.get_by_id_user_id(id, user_id))
+
+    async def delete(self, task: TaskEntity):
+        return await self._run(lambda service: service.delete(task))
+
+    async def delete_by_id_user_id(self, id: int, user_id: int) -> bool:
+        return await self._run(lambda service: service.delete_by_id_user_id(id, user_id))
+
+    async def create(self, user_id: int, dto: CreateTaskDTO) -> TaskEntity:
+        return await self._run(lambda service: service.create(user_id, dto))
+
+    async def create_many(self, user_id: int, dtos: list[CreateTaskDTO]) -> list[TaskOUT]:
+        return await self._run(lambda service: service.create_many(user_id, dtos))
+
+    async def update_many(self, user_id: int, filters: TaskFilter, dto: BulkUpdateTaskDTO) -> list[TaskOUT]:
+        return await self._run(lambda service: service.update_many(user_id, filters, dto))
+
+    async def update_by_id_user_id(self, id: int, user_id: int, dto: UpdateTaskDTO) -> TaskOUT | None:
+        return await self._run(lambda service: service.update_by_id_user_id(id, user_id, dto))
+
+    async def change_status_done_by_id_user_id(self, id: int, user_id: int) -> TaskOUT | None:
+        return await self._run(lambda service: service.change_status_done_by_id_user_id(id, user_id))
+
+    async def delete_many(self, user_id: int, ids: list[int] | None, filters: TaskFilter) -> list[int]:
+        return await self._run(lambda service: service.delete_many(user_id, ids, filters))
+
+    async def get_page_user_id_filtered(self, user_id: int, filters: TaskFilter, q: str | None = None) -> Page[TaskOUT]:
+        return await self._run(lambda service: service.get_page_user_id_filtered(user_id, filters, q))
+
+    def stream_user_id_filtered(self, user_id: int, filters: TaskFilter) -> AsyncIterator[TaskOUT]:
+        return self._stream(lambda service: service.stream_user_id_filtered(user_id, filters))
+
+    async def get_with_etag_by_id_user_id(self, id: int, user_id: int) -> tuple[TaskOUT, str] | None:
+        return await self._run(lambda service: service.get_with_etag_by_id_user_id(id, user_id))
+
+    async def get_list_etag(self, user_id: int, query: str) -> str:
+        return await self._run(lambda service: service.get_list_etag(user_id, query))
+
+    async def get_changes_user_id(self, user_id: int, since: TaskChangesCursor | None, limit: int) -> TaskChangesOUT:
+        return await self._run(lambda service: service.get_changes_user_id(user_id, since, limit))
+
+    async def get_stats_user_id_filtered(self, user_id: int, filters: TaskFilter) -> TaskStatsOUT:
+        return await self._run(lambda service: service.get_stats_user_id_filtered(user_id, filters))
+
+    async def get_cursor_page_user_id_filtered(self, user_id: int, filters: TaskFilter, sort_by: TaskSortKey, size: int, cursor: TaskCursor | None) -> TaskCursorPage:
+        return await self._run(lambda service: service.get_cursor_page_user_id_filtered(user_id, filters, sort_by, size, cursor))
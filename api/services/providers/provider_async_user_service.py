@@ -0,0 +1,43 @@
+from api.services.providers.provider_async_service import AsyncServiceProvider
+from api.services.providers.provider_user_service import UserServiceProvider
+from api.services.providers.provider_crypto_service import hash_password_async
+from api.repositories.providers.provider_user_repository import UserRepositoryProvider
+from api.models.entities.user_entity import UserEntity
+from api.models.schemas.user_schemas import UpdateUserDTO, CreateUserDTO
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Final
+
+class AsyncUserServiceProvider(AsyncServiceProvider[UserServiceProvider]):
+    def __init__(self, db: Session | AsyncSession):
+        super().__init__(db, lambda session: UserServiceProvider(UserRepositoryProvider(session)))
+
+    async def get_by_id(self, id: int) -> UserEntity | None:
+        return await self._run(lambda service: service.get_by_id(id))
+
+    async def exists_by_id(self, id: int) -> bool:
+        return await self._run(lambda service: service.exists_by_id(id))
+
+    async def get_by_email(self, email: str) -> UserEntity | None:
+        return await self._run(lambda service: service.get_by_email(email))
+
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._run(lambda service: service.exists_by_email(email))
+
+    async def delete(self, user: UserEntity):
+        return await self._run(lambda service: service.delete(user))
+
+    # bcrypt runs in the password pool before the service call, not inside it on the loop or a request thread
+    async def create(self, dto: CreateUserDTO) -> UserEntity | None:
+        password_hash: Final[str] = await hash_password_async(dto.password)
+        return await self._run(lambda service: service.create(dto, password_hash))
+
+    async def set_refresh_token(self, refresh_token: str, user: UserEntity) -> UserEntity:
+        return await self._run(lambda service: service.set_refresh_token(refresh_token, user))
+
+    async def set_password_hash(self, password_hash: str, user: UserEntity) -> UserEntity:
+        return await self._run(lambda service: service.set_password_hash(password_hash, user))
+
+    async def update(self, user: UserEntity, dto: UpdateUserDTO) -> UserEntity:
+        password_hash: Final[str | None] = await hash_password_async(dto.password) if dto.password is not None else None
+        return await self._run(lambda service: service.update(user, dto, password_hash))
@@ -1,9 +1,92 @@
+import logging
+import math
+import os
+import time
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
+from pydantic import BaseModel
+from api.configs.crypto.password_pool import password_pool
+from typing import Final
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 pwd_context: CryptContext = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+PASSWORD_HASH_TARGET_MS: Final[float] = float(os.getenv("PASSWORD_HASH_TARGET_MS", "250"))
+PASSWORD_HASH_ROUNDS: Final[str | None] = os.getenv("PASSWORD_HASH_ROUNDS")
+MIN_ROUNDS: Final[int] = 10
+MAX_ROUNDS: Final[int] = 16
+
+class PasswordCost(BaseModel):
+    rounds: int
+    target_ms: float
+    estimated_ms: float
+    calibrated: bool
+
+password_cost: PasswordCost | None = None
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(password, hashed_password)
+
+def verify_and_update_password(password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verifies, and when the hash needs_update returns a new one at the current cost."""
+    return pwd_context.verify_and_update(password, hashed_password)
+
+def set_password_rounds(rounds: int):
+    # only a hash below this cost needs_update; a stronger one, from a faster machine or an earlier
+    # calibration, is kept, so a cost that moves between restarts never downgrades or rewrites hashes back and forth
+    pwd_context.update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds)
+
+def calibrate_password_rounds(target_seconds: float, probe_rounds: int = 8) -> tuple[int, float]:
+    """Returns the most bcrypt rounds whose hash stays within target_seconds on this machine, and their estimated
+    time, clamped to MIN_ROUNDS..MAX_ROUNDS (so MIN_ROUNDS can exceed the target on a slow machine).
+
+    Each round doubles bcrypt's work, so timing a cheap probe is enough to place the rest. Rounding down rather
+    than to the closest cost keeps a probe near a boundary on the cheaper one instead of flipping between two
+    on every restart; set_password_rounds makes it the minimum, so hashes above it are never rewritten.
+    """
+    timings: Final[list[float]] = []
+    for _ in range(3):
+        started = time.perf_counter()
+        bcrypt.using(rounds=probe_rounds).hash("calibration")
+        timings.append(time.perf_counter() - started)
+
+    probe: Final[float] = min(timings)
+    rounds: Final[int] = max(MIN_ROUNDS, min(MAX_ROUNDS, probe_rounds + math.floor(math.log2(target_seconds / probe))))
+
+    return rounds, probe * 2 ** (rounds - probe_rounds)
+
+def configure_password_hashing() -> PasswordCost:
+    global password_cost
+
+    # once per process, the app can be started again in the same one (tests)
+    if password_cost is not None:
+        return password_cost
+
+    if PASSWORD_HASH_ROUNDS:
+        password_cost = PasswordCost(
+            rounds=int(PASSWORD_HASH_ROUNDS), target_ms=PASSWORD_HASH_TARGET_MS, estimated_ms=0, calibrated=False
+        )
+    else:
+        rounds, estimated = calibrate_password_rounds(PASSWORD_HASH_TARGET_MS / 1000)
+        password_cost = PasswordCost(
+            rounds=rounds, target_ms=PASSWORD_HASH_TARGET_MS, estimated_ms=round(estimated * 1000, 1), calibrated=True
+        )
+
+    set_password_rounds(password_cost.rounds)
+    password_pool.configure_workers(set_password_rounds, password_cost.rounds)
+    logger.info("Password hashing uses bcrypt with %s rounds (about %sms)", password_cost.rounds, password_cost.estimated_ms)
+
+    return password_cost
+
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run(hash_password, password)
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, password, hashed_password)
+
+async def verify_and_update_password_async(password: str, hashed_password: str) -> tuple[bool, str | None]:
+    return await password_pool.run(verify_and_update_password, password, hashed_password)
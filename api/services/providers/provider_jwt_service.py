@@ -2,6 +2,8 @@ from api.services.base.base_jwt_service import BaseJwtService
 import os
 from dotenv import load_dotenv
 from api.models.entities.user_entity import UserEntity
+from api.models.schemas.user_schemas import Principal
+from api.configs.auth.token_cache import token_cache
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from fastapi import Header, HTTPException, status
@@ -50,9 +52,14 @@ class JwtServiceProvider(BaseJwtService):
         if ACCESS_TOKEN_EXPIRE_MINUTES is None or SECRET_KEY is None or ALGORITHM is None:
             raise ValueError("ACCESS_TOKEN_EXPIRE_MINUTES is not defined")
 
+        cached: Final[dict | None] = token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try :
             payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHM)
 
+            token_cache.put(token, payload)
             return payload
         except JWTError:
             return None
@@ -63,6 +70,16 @@ class JwtServiceProvider(BaseJwtService):
             return int(payload["sub"])
         return None
 
+    def principal_from_token(self, token: str) -> Principal | None:
+        payload = self.decode_token(token)
+        if payload is None or "sub" not in payload or "email" not in payload or "exp" not in payload:
+            return None
+
+        return Principal(user_id=int(payload["sub"]), email=payload["email"], exp=payload["exp"])
+
+    def invalidate_user_tokens(self, user_id: int):
+        token_cache.invalidate_user(user_id)
+
     def extract_email(self, token: str) -> str | None:
         payload = self.decode_token(token)
         if payload and "email" in payload:
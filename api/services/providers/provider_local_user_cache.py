@@ -0,0 +1,43 @@
+import threading
+import time
+from api.services.base.base_user_cache import BaseUserCache
+from typing import Final
+
+class LocalUserCacheProvider(BaseUserCache):
+    """Ids of users known to exist, for `ttl` seconds, in this process only.
+
+    Another worker doesn't see this one's invalidations, so with several workers a deleted user is
+    still trusted there for up to `ttl`; use the shared backend when that matters.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._until: Final[dict[int, float]] = {}
+        self._lock: Final[threading.Lock] = threading.Lock()
+
+    def contains(self, user_id: int) -> bool:
+        with self._lock:
+            return self._until.get(user_id, 0.0) > time.monotonic()
+
+    def add(self, user_id: int):
+        now: Final[float] = time.monotonic()
+
+        with self._lock:
+            self._until[user_id] = now + self.ttl
+
+            if len(self._until) > self.max_size:
+                for expired in [key for key, until in self._until.items() if until <= now]:
+                    del self._until[expired]
+
+                # still full of live entries: drop the ones closest to expiring
+                for oldest in sorted(self._until, key=self._until.__getitem__)[:len(self._until) - self.max_size]:
+                    del self._until[oldest]
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._until.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._until.clear()
@@ -0,0 +1,32 @@
+from api.services.base.base_user_cache import BaseUserCache
+from typing import Final
+
+class RedisUserCacheProvider(BaseUserCache):
+    """Shared by every worker, so a delete or update invalidates the user everywhere at once."""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "user:exists:"):
+        try:
+            import redis
+        except ImportError as error:
+            raise ImportError("USER_CACHE_URL needs the redis package: pip install redis") from error
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.prefix}{user_id}"
+
+    def contains(self, user_id: int) -> bool:
+        return self.client.exists(self._key(user_id)) == 1
+
+    def add(self, user_id: int):
+        self.client.set(self._key(user_id), 1, px=int(self.ttl * 1000))
+
+    def invalidate(self, user_id: int):
+        self.client.delete(self._key(user_id))
+
+    def clear(self):
+        keys: Final[list] = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
@@ -1,10 +1,15 @@
 from api.services.base.base_task_service import BaseTaskService
 from api.models.entities.task_entity import TaskEntity
-from api.models.entities.user_entity import UserEntity
+from api.models.entities.task_counter_entity import NO_PRIORITY
 from api.utils.filters.task_filter import TaskFilter
-from typing import List, Final
+from typing import List, Final, Iterator
+from api.utils.res.etag import make_etag
 from api.repositories.base.base_task_repository import BaseTaskRepository
-from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO
+from api.models.schemas.task_schemas import UpdateTaskDTO, CreateTaskDTO, TaskOUT, TaskCursorPage, TaskStatsOUT, TaskChangesOUT, BulkUpdateTaskDTO
+from api.utils.pagination.task_cursor import TaskCursor, TaskSortKey, TaskChangesCursor
+from fastapi_pagination import Page
+
+COUNTED_FIELDS: Final[frozenset[str]] = frozenset({"priority", "is_done", "due_date"})
 
 class TaskServiceProvider(BaseTaskService):
     def __init__(self, repository: BaseTaskRepository):
@@ -16,25 +21,174 @@ class TaskServiceProvider(BaseTaskService):
 
         return self.repository.get_by_id(id)
 
+    def get_by_id_user_id(self, id: int, user_id: int) -> (TaskEntity | None):
+        if id <= 0 or id is None:
+            return None
+
+        return self.repository.get_by_id_user_id(id, user_id)
+
     def get_all_user_id_filtered(self, user_id: int, filters: TaskFilter) -> list[TaskEntity]:
         return self.repository.get_all_user_id_filtered(user_id, filters)
 
+    def get_page_user_id_filtered(self, user_id: int, filters: TaskFilter, q: str | None = None) -> Page[TaskOUT]:
+        if q is not None and q.strip() == "":
+            q = None
+
+        return self.repository.get_page_user_id_filtered(user_id, filters, q)
+
+    def stream_user_id_filtered(self, user_id: int, filters: TaskFilter) -> Iterator[TaskOUT]:
+        return self.repository.stream_user_id_filtered(user_id, filters)
+
+    def get_with_etag_by_id_user_id(self, id: int, user_id: int) -> tuple[TaskOUT, str] | None:
+        if id <= 0 or id is None:
+            return None
+
+        row: Final = self.repository.get_with_revision_by_id_user_id(id, user_id)
+        if row is None:
+            return None
+
+        return TaskEntity.row_to_task_out(row), make_etag(row.id, row.updated_at, row.revision)
+
+    def get_list_etag(self, user_id: int, query: str) -> str:
+        watermark: Final = self.repository.get_watermark_user_id(user_id)
+
+        return make_etag(user_id, watermark.revision, watermark.total, watermark.updated_at, query)
+
+    def get_changes_user_id(self, user_id: int, since: TaskChangesCursor | None, limit: int) -> TaskChangesOUT:
+        return self.repository.get_changes_user_id(user_id, since, limit)
+
+    def get_stats_user_id_filtered(self, user_id: int, filters: TaskFilter) -> TaskStatsOUT:
+        return self.repository.get_stats_user_id_filtered(user_id, filters)
+
+    def get_cursor_page_user_id_filtered(self, user_id: int, filters: TaskFilter, sort_by: TaskSortKey, size: int, cursor: TaskCursor | None) -> TaskCursorPage:
+        return self.repository.get_cursor_page_user_id_filtered(user_id, filters, sort_by, size, cursor)
+
     def delete(self, task: TaskEntity):
-        self.repository.delete(task)
+        self.delete_by_id_user_id(task.id, task.user_id)
+
+    def delete_by_id_user_id(self, id: int, user_id: int) -> bool:
+        # one DELETE ... RETURNING, so the counters follow the deleted row and not a copy read earlier
+        return len(self.delete_many(user_id, [id], TaskFilter())) > 0
         
-    def create(self, user: UserEntity, dto: CreateTaskDTO) -> TaskEntity:
+    def create(self, user_id: int, dto: CreateTaskDTO) -> TaskEntity:
         task_mapped: Final[TaskEntity] = dto.to_task_entity()
-        task_mapped.user_id = user.id
+        task_mapped.user_id = user_id
+        task_mapped.change_seq = self.repository.next_change_seq(user_id)
 
+        self._apply_counters(user_id, removed=[], added=[self._counters_of(task_mapped)])
         return self.repository.create(task_mapped)
 
+    def create_many(self, user_id: int, dtos: list[CreateTaskDTO]) -> list[TaskOUT]:
+        if len(dtos) == 0:
+            return []
+
+        change_seq: Final[int] = self.repository.next_change_seq(user_id)
+
+        self._apply_counters(user_id, removed=[], added=[self._counters_of(dto) for dto in dtos])
+        return self.repository.create_many([dict(dto.model_dump(), user_id=user_id, change_seq=change_seq) for dto in dtos])
+
+    def update_many(self, user_id: int, filters: TaskFilter, dto: BulkUpdateTaskDTO) -> list[TaskOUT]:
+        change_seq: Final[int] = self.repository.next_change_seq(user_id)
+
+        before, after = self.repository.update_many_user_id(
+            user_id, dto.ids, filters, dict(dto.patch.model_dump(exclude_unset=True), change_seq=change_seq), dto.toggle_is_done
+        )
+
+        if len(after) == 0:
+            return []
+
+        self._apply_counters(
+            user_id,
+            removed=[self._counters_of(row) for row in before],
+            added=[self._counters_of(row) for row in after],
+        )
+
+        return [TaskEntity.row_to_task_out(row) for row in after]
+
+    def update_by_id_user_id(self, id: int, user_id: int, dto: UpdateTaskDTO) -> TaskOUT | None:
+        return self._update_owned(id, user_id, dto.model_dump(exclude_unset=True), toggle_is_done=False)
+
+    def change_status_done_by_id_user_id(self, id: int, user_id: int) -> TaskOUT | None:
+        return self._update_owned(id, user_id, {}, toggle_is_done=True)
+
+    def _update_owned(self, id: int, user_id: int, values: dict, toggle_is_done: bool) -> TaskOUT | None:
+        # taken first, so every write of a user locks the sequence row before its tasks and counters
+        change_seq: Final[int] = self.repository.next_change_seq(user_id)
+
+        # the previous row is only read when a counted field is overwritten, otherwise it follows from the returned one
+        before = None
+        if COUNTED_FIELDS & values.keys():
+            before = self.repository.get_counter_state_by_id_user_id(id, user_id)
+            if before is None:
+                return None
+
+        after: Final = self.repository.update_by_id_user_id(id, user_id, dict(values, change_seq=change_seq), toggle_is_done)
+        if after is None:
+            return None
+
+        previous: Final = before if before is not None else TaskEntity(
+            priority=after.priority,
+            is_done=not after.is_done if toggle_is_done else after.is_done,
+            due_date=after.due_date,
+        )
+
+        self._apply_counters(user_id, removed=[self._counters_of(previous)], added=[self._counters_of(after)])
+
+        return TaskEntity.row_to_task_out(after)
+
+    def delete_many(self, user_id: int, ids: list[int] | None, filters: TaskFilter) -> list[int]:
+        change_seq: Final[int] = self.repository.next_change_seq(user_id)
+        deleted: Final = self.repository.delete_many_user_id(user_id, ids, filters, change_seq)
+
+        if len(deleted) == 0:
+            return []
+
+        self._apply_counters(user_id, removed=[self._counters_of(row) for row in deleted], added=[])
+
+        return [row.id for row in deleted]
+
     def update(self, task: TaskEntity, dto: UpdateTaskDTO) -> TaskEntity:
+        counters_before: Final = self._counters_of(task)
+
         for field, value in dto.model_dump(exclude_unset=True).items():
             setattr(task, field, value)
+        task.change_seq = self.repository.next_change_seq(task.user_id)
 
+        self._apply_counters(task.user_id, removed=[counters_before], added=[self._counters_of(task)])
         return self.repository.save(task)
     
     def change_status_done(self, task: TaskEntity) -> TaskEntity:   
+        counters_before: Final = self._counters_of(task)
         task.is_done = not task.is_done
+        task.change_seq = self.repository.next_change_seq(task.user_id)
+
+        self._apply_counters(task.user_id, removed=[counters_before], added=[self._counters_of(task)])
+        return self.repository.save(task)
+
+    def _counters_of(self, task) -> tuple[int, int, int, int]:
+        is_done: Final[bool] = bool(task.is_done)
+
+        return (
+            task.priority if task.priority is not None else NO_PRIORITY,
+            1,
+            int(is_done),
+            int(not is_done and task.due_date is not None),
+        )
+
+    def _apply_counters(self, user_id: int, removed: list[tuple], added: list[tuple]):
+        deltas: Final[dict[int, list[int]]] = {}
+
+        for counters, sign in [(counters, -1) for counters in removed] + [(counters, 1) for counters in added]:
+            priority, *values = counters
+            delta = deltas.setdefault(priority, [0, 0, 0])
+            for index, value in enumerate(values):
+                delta[index] += sign * value
+
+        changed: Final = [(priority, delta) for priority, delta in deltas.items() if any(delta)]
+
+        # every write bumps the revision once, even when no count moves, so list ETags change
+        if not changed:
+            changed.append((next(reversed(deltas)), [0, 0, 0]))
 
-        return self.repository.save(task)
\ No newline at end of file
+        for index, (priority, (total, done, dated_pending)) in enumerate(changed):
+            self.repository.apply_counter_delta(user_id, priority, total, done, dated_pending, revision=1 if index == 0 else 0)
\ No newline at end of file
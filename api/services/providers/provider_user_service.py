@@ -1,14 +1,19 @@
 from api.services.base.base_user_service import BaseUserService
 from sqlalchemy.orm import Session
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from typing import Final
 from api.models.entities.user_entity import UserEntity
 from api.models.schemas.user_schemas import UpdateUserDTO, CreateUserDTO
 from api.repositories.base.base_user_repository import BaseUserRepository
+from api.services.base.base_user_cache import BaseUserCache
+from api.configs.cache.user_cache import user_cache
 from api.services.providers.provider_crypto_service import *
 
 class UserServiceProvider(BaseUserService):
-    def __init__(self, repository: BaseUserRepository):
+    def __init__(self, repository: BaseUserRepository, cache: BaseUserCache = user_cache):
         self.repository = repository
+        self.cache = cache
 
     def get_by_id(self, id: int) -> UserEntity | None:
         if id is None or id <= 0:
@@ -16,6 +21,19 @@ class UserServiceProvider(BaseUserService):
 
         return self.repository.get_by_id(id)
 
+    def exists_by_id(self, id: int) -> bool:
+        if id is None or id <= 0:
+            return False
+
+        if self.cache.contains(id):
+            return True
+
+        exists: Final[bool] = self.repository.exists_by_id(id)
+        if exists:
+            self.cache.add(id)
+
+        return exists
+
     def get_by_email(self, email: str) -> UserEntity | None:
         if email is None or email == "":
             return None
@@ -26,13 +44,20 @@ class UserServiceProvider(BaseUserService):
         return self.repository.exists_by_email(email)
 
     def delete(self, user: UserEntity):
+        self.cache.invalidate(user.id)
         return self.repository.delete(user)
 
-    def create(self, dto: CreateUserDTO) -> UserEntity:
+    def create(self, dto: CreateUserDTO, password_hash: str | None = None) -> UserEntity | None:
         user_mapped = dto.to_user_entity()
-        user_mapped.password = hash_password(user_mapped.password)
+        user_mapped.password = password_hash if password_hash is not None else hash_password(user_mapped.password)
 
-        user_created = self.repository.create(user_mapped)
+        # a concurrent register of the same email fails on the unique index, only this insert is undone
+        try:
+            with self.repository.savepoint():
+                user_created = self.repository.create(user_mapped)
+
+        except IntegrityError:
+            return None
 
         return user_created
 
@@ -41,11 +66,16 @@ class UserServiceProvider(BaseUserService):
         user.refresh_token = refresh_token
         return self.repository.save(user)
 
-    def update(self, user: UserEntity, dto: UpdateUserDTO) -> UserEntity:
+    def set_password_hash(self, password_hash: str, user: UserEntity) -> UserEntity:
+        user.password = password_hash
+        return self.repository.save(user)
+
+    def update(self, user: UserEntity, dto: UpdateUserDTO, password_hash: str | None = None) -> UserEntity:
         if dto.name != None :
             user.name = dto.name
 
         if dto.password != None :
-            user.password = hash_password(dto.password)
+            user.password = password_hash if password_hash is not None else hash_password(dto.password)
 
+        self.cache.invalidate(user.id)
         return self.repository.update(user)     
@@ -1,7 +1,8 @@
 from api.models.entities.task_entity import TaskEntity
 from fastapi_filter.contrib.sqlalchemy import Filter
 from pydantic import Field
-from typing import Optional
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from typing import Final, Optional
 from datetime import date, datetime
 
 class TaskFilter(Filter):
@@ -18,3 +19,43 @@ class TaskFilter(Filter):
 
     class Constants(Filter.Constants):
         model = TaskEntity
+
+    def filter_lambda(self, stmt: StatementLambdaElement) -> StatementLambdaElement:
+        """Same criteria as filter(), added as lambdas.
+
+        SQLAlchemy caches a chain of lambdas by where each one is written, so every filter shape (which fields
+        are set, not their values) builds its expression and cache key once; later requests only bind the values.
+        """
+        if self.title__ilike is not None:
+            title: Final[str] = _like_pattern(self.title__ilike)
+            stmt += lambda s: s.where(TaskEntity.title.ilike(title))
+        if self.description__ilike is not None:
+            description: Final[str] = _like_pattern(self.description__ilike)
+            stmt += lambda s: s.where(TaskEntity.description.ilike(description))
+        if self.is_done is not None:
+            is_done: Final[bool] = self.is_done
+            stmt += lambda s: s.where(TaskEntity.is_done == is_done)
+        if self.priority__gte is not None:
+            priority_gte: Final[int] = self.priority__gte
+            stmt += lambda s: s.where(TaskEntity.priority >= priority_gte)
+        if self.priority__lte is not None:
+            priority_lte: Final[int] = self.priority__lte
+            stmt += lambda s: s.where(TaskEntity.priority <= priority_lte)
+        if self.created_at__gte is not None:
+            created_at_gte: Final[datetime] = self.created_at__gte
+            stmt += lambda s: s.where(TaskEntity.created_at >= created_at_gte)
+        if self.created_at__lte is not None:
+            created_at_lte: Final[datetime] = self.created_at__lte
+            stmt += lambda s: s.where(TaskEntity.created_at <= created_at_lte)
+        if self.due_date__gte is not None:
+            due_date_gte: Final[date] = self.due_date__gte
+            stmt += lambda s: s.where(TaskEntity.due_date >= due_date_gte)
+        if self.due_date__lte is not None:
+            due_date_lte: Final[date] = self.due_date__lte
+            stmt += lambda s: s.where(TaskEntity.due_date <= due_date_lte)
+
+        return stmt
+
+def _like_pattern(value: str) -> str:
+    # filter() wraps a value without % the same way
+    return value if "%" in value else f"%{value}%"
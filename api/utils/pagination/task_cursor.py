@@ -0,0 +1,53 @@
+from pydantic import BaseModel, Field
+from typing import Literal, Final
+from datetime import date, datetime
+import base64
+import binascii
+
+TaskSortKey = Literal["created_at", "due_date"]
+
+class TaskCursorParams(BaseModel):
+    paging: Literal["offset", "cursor"] = Field("offset", description="Pagination mode, 'cursor' enables keyset pagination.")
+    cursor: str | None = Field(None, description="Opaque cursor taken from next_cursor or previous_cursor.")
+    sort_by: TaskSortKey = Field("created_at", description="Sort key used in cursor mode, ties are broken by id.")
+
+class TaskCursor(BaseModel):
+    sort_by: TaskSortKey
+    key: str | None
+    id: int
+    backwards: bool = False
+
+    def key_value(self) -> datetime | date | None:
+        if self.key is None:
+            return None
+
+        if self.sort_by == "due_date":
+            return date.fromisoformat(self.key)
+
+        return datetime.fromisoformat(self.key)
+
+def encode_task_cursor(cursor: TaskCursor) -> str:
+    return base64.urlsafe_b64encode(cursor.model_dump_json().encode()).decode()
+
+def decode_task_cursor(token: str) -> TaskCursor | None:
+    try:
+        cursor: Final[TaskCursor] = TaskCursor.model_validate_json(base64.urlsafe_b64decode(token.encode()))
+        cursor.key_value()
+        return cursor
+    except (binascii.Error, ValueError):
+        return None
+
+class TaskChangesCursor(BaseModel):
+    task_seq: int = 0
+    task_id: int = 0
+    tombstone_seq: int = 0
+    tombstone_id: int = 0
+
+def encode_task_changes_cursor(cursor: TaskChangesCursor) -> str:
+    return base64.urlsafe_b64encode(cursor.model_dump_json().encode()).decode()
+
+def decode_task_changes_cursor(token: str) -> TaskChangesCursor | None:
+    try:
+        return TaskChangesCursor.model_validate_json(base64.urlsafe_b64decode(token.encode()))
+    except (binascii.Error, ValueError):
+        return None
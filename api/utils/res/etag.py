@@ -0,0 +1,15 @@
+from typing import Any, Final
+import hashlib
+
+def make_etag(*parts: Any) -> str:
+    digest: Final[str] = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    candidates: Final[list[str]] = [candidate.strip() for candidate in if_none_match.split(",")]
+    opaque: Final[str] = etag.removeprefix("W/")
+
+    return "*" in candidates or any(candidate.removeprefix("W/") == opaque for candidate in candidates)
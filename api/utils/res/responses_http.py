@@ -14,4 +14,9 @@ RESPONSE_404_USER: Final[Dict] = {
 RESPONSE_500: Final[Dict] = {
     "description": "User not found",
     "model": ResponseBody[Any]
-}
\ No newline at end of file
+}
+
+RESPONSE_503_PASSWORD: Final[Dict] = {
+    "description": "Too many password checks queued, retry after the Retry-After seconds",
+    "model": ResponseBody[None]
+}
@@ -0,0 +1,42 @@
+from api.models.schemas.task_schemas import TaskOUT
+from typing import AsyncIterable, AsyncIterator, Final, Literal
+import csv
+import io
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: Final[dict[str, str]] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+async def tasks_to_ndjson(tasks: AsyncIterable[TaskOUT], chunk_size: int = 500) -> AsyncIterator[str]:
+    chunk: list[str] = []
+
+    async for task in tasks:
+        chunk.append(task.model_dump_json())
+
+        if len(chunk) >= chunk_size:
+            yield "\n".join(chunk) + "\n"
+            chunk.clear()
+
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+async def tasks_to_csv(tasks: AsyncIterable[TaskOUT], chunk_size: int = 500) -> AsyncIterator[str]:
+    buffer: Final[io.StringIO] = io.StringIO()
+    writer: Final = csv.DictWriter(buffer, fieldnames=list(TaskOUT.model_fields))
+    writer.writeheader()
+
+    index: int = 0
+
+    async for task in tasks:
+        index += 1
+        writer.writerow(task.model_dump())
+
+        if index % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
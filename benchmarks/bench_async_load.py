@@ -0,0 +1,92 @@
+# python -m benchmarks.bench_async_load
+#
+# Runs the same concurrent read load once per database url, in a fresh process each, since the
+# sync/async stack is picked from DATABASE_URL at import time. Point both at Postgres with
+# BENCH_SYNC_URL=postgresql://... BENCH_ASYNC_URL=postgresql+asyncpg://... for meaningful numbers.
+
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Final
+
+DATABASE_FILE: Final[str] = os.path.join(tempfile.gettempdir(), "bench_async_load.db")
+
+URLS: Final[dict[str, str]] = {
+    "sync": os.getenv("BENCH_SYNC_URL", f"sqlite:///{DATABASE_FILE}"),
+    "async": os.getenv("BENCH_ASYNC_URL", f"sqlite+aiosqlite:///{DATABASE_FILE}"),
+}
+
+REQUESTS: Final[int] = int(os.getenv("BENCH_REQUESTS", "2000"))
+CONCURRENCY: Final[int] = int(os.getenv("BENCH_CONCURRENCY", "200"))
+TASKS: Final[int] = 500
+
+async def load(mode: str):
+    import asyncio
+    import logging
+    import statistics
+    import time
+    import uuid
+    import httpx
+    from api.configs.db.database import create_tables, engine, async_engine
+    from main import app
+
+    engine.echo = False
+    if async_engine is not None:
+        async_engine.echo = False
+    logging.disable(logging.INFO)
+    create_tables()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        name: Final[str] = f"bench{uuid.uuid4().hex[:8]}"
+        response: Final = await client.post(
+            "/api/v1/auth/register",
+            json={"name": name, "email": f"{name}@example.com", "password": "benchmark"},
+        )
+        headers: Final[dict] = {"Authorization": f"Bearer {response.json()['body']['token']}"}
+
+        await client.post(
+            "/api/v1/task/batch",
+            json=[{"title": f"task {index}", "priority": index % 10 + 1} for index in range(TASKS)],
+            headers=headers,
+        )
+
+        semaphore: Final = asyncio.Semaphore(CONCURRENCY)
+        latencies: Final[list[float]] = []
+
+        async def request(index: int):
+            async with semaphore:
+                started: float = time.perf_counter()
+                response = await client.get("/api/v1/task", params={"page": index % 10 + 1, "size": 20}, headers=headers)
+                latencies.append(time.perf_counter() - started)
+
+                assert response.status_code == 200, response.text
+
+        started: Final[float] = time.perf_counter()
+        await asyncio.gather(*(request(index) for index in range(REQUESTS)))
+        elapsed: Final[float] = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{mode:>6}: {REQUESTS} requests, concurrency {CONCURRENCY}, {REQUESTS / elapsed:,.0f} req/s, "
+        f"p50 {statistics.median(latencies) * 1000:.1f}ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f}ms"
+    )
+
+def main():
+    if len(sys.argv) > 1:
+        import asyncio
+
+        asyncio.run(load(sys.argv[1]))
+        return
+
+    for mode, url in URLS.items():
+        env = dict(os.environ, DATABASE_URL=url)
+        env.setdefault("SECRET_KEY", "bench-secret")
+        env.setdefault("ALGORITHM", "HS256")
+        env.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+        env.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "120")
+
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_async_load", mode], env=env, check=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# python -m benchmarks.bench_auth_commits
+
+import os
+import tempfile
+
+DATABASE_FILE: str = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DATABASE_FILE}")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "120")
+
+import logging
+import time
+from typing import Final
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event
+from api.configs.db.database import engine
+from api.configs.db.unit_of_work import after_write_commit
+from api.services.providers import provider_async_service
+from main import app
+
+FLOWS: Final[int] = 30
+
+write_commits: list[int] = [0]
+
+@event.listens_for(Engine, "connect")
+def _synchronous_full(dbapi_connection, connection_record):
+    # every commit waits for the fsync, as a durable Postgres commit would
+    if engine.dialect.name == "sqlite":
+        dbapi_connection.execute("PRAGMA synchronous=FULL")
+
+def count_commit(session, created_user_ids: set[int]):
+    write_commits[0] += 1
+
+def flow(client: TestClient, name: str):
+    user: Final[dict] = {"name": name, "email": f"{name}@example.com", "password": "benchmark"}
+
+    assert client.post("/api/v1/auth/register", json=user).status_code == 201
+    login: Final = client.post("/api/v1/auth/login", json={"email": user["email"], "password": user["password"]})
+    assert client.get(f"/api/v1/auth/{login.json()['body']['refresh_token']}").status_code == 200
+
+def run(client: TestClient, mode: str) -> tuple[float, int]:
+    write_commits[0] = 0
+    started: Final[float] = time.perf_counter()
+
+    for index in range(FLOWS):
+        flow(client, f"bench{mode}{index}")
+
+    return time.perf_counter() - started, write_commits[0]
+
+def main():
+    engine.echo = False
+    logging.disable(logging.INFO)
+    after_write_commit(count_commit)
+
+    with TestClient(app) as client:
+        elapsed, commits = run(client, "unit")
+        print(f"{'unit of work':>14}: {FLOWS} register/login/refresh flows in {elapsed:.2f}s, {commits / FLOWS:.1f} write commits per flow")
+
+        # the previous behaviour: every service call commits its own writes
+        provider_async_service.has_writes = lambda session: False
+
+        elapsed, commits = run(client, "call")
+        print(f"{'per call':>14}: {FLOWS} register/login/refresh flows in {elapsed:.2f}s, {commits / FLOWS:.1f} write commits per flow")
+
+if __name__ == "__main__":
+    main()
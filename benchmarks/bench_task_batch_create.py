@@ -0,0 +1,61 @@
+# python -m benchmarks.bench_task_batch_create
+
+import os
+import tempfile
+
+DATABASE_FILE: str = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{DATABASE_FILE}")
+os.environ.setdefault("SECRET_KEY", "bench-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "120")
+
+import logging
+import time
+from typing import Final
+from fastapi.testclient import TestClient
+from api.configs.db.database import engine
+from main import app
+
+TASKS: Final[int] = 2_000
+BATCH_SIZE: Final[int] = 500
+
+def register(client: TestClient, name: str) -> dict:
+    response: Final = client.post(
+        "/api/v1/auth/register",
+        json={"name": name, "email": f"{name}@example.com", "password": "benchmark"},
+    )
+    return {"Authorization": f"Bearer {response.json()['body']['token']}"}
+
+def payload(index: int) -> dict:
+    return {"title": f"task {index}", "description": f"description {index}", "priority": index % 10 + 1}
+
+def single_item(client: TestClient, headers: dict) -> float:
+    started: Final[float] = time.perf_counter()
+
+    for index in range(TASKS):
+        assert client.post("/api/v1/task", json=payload(index), headers=headers).status_code == 201
+
+    return time.perf_counter() - started
+
+def batched(client: TestClient, headers: dict) -> float:
+    started: Final[float] = time.perf_counter()
+
+    for offset in range(0, TASKS, BATCH_SIZE):
+        items = [payload(index) for index in range(offset, offset + BATCH_SIZE)]
+        assert client.post("/api/v1/task/batch", json=items, headers=headers).status_code == 201
+
+    return time.perf_counter() - started
+
+def main():
+    engine.echo = False
+    logging.disable(logging.INFO)
+
+    with TestClient(app) as client:
+        for name, path in [("single", single_item), ("batch", batched)]:
+            elapsed = path(client, register(client, f"bench{name}"))
+            print(f"{name:>8}: {TASKS} tasks in {elapsed:.2f}s, {TASKS / elapsed:,.0f} tasks/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# python -m benchmarks.bench_task_read_path
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import gc
+import time
+import tracemalloc
+from typing import Callable, Final
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from api.configs.db.database import Base
+from api.models.entities.user_entity import UserEntity
+from api.models.entities.task_entity import TaskEntity
+
+SIZES: Final[list[int]] = [1_000, 10_000, 100_000]
+
+def seed(session: Session, rows: int) -> int:
+    user: Final[UserEntity] = UserEntity(name="bench", email=f"bench{rows}@example.com", password="x")
+    session.add(user)
+    session.flush()
+
+    session.execute(insert(TaskEntity), [
+        {"title": f"task {i}", "description": f"description {i}", "priority": i % 10 + 1, "user_id": user.id}
+        for i in range(rows)
+    ])
+    session.commit()
+
+    return user.id
+
+def orm_path(session: Session, user_id: int) -> list:
+    tasks: Final = session.execute(select(TaskEntity).where(TaskEntity.user_id == user_id)).scalars().all()
+    return [task.to_task_out() for task in tasks]
+
+def projected_path(session: Session, user_id: int) -> list:
+    rows: Final = session.execute(select(*TaskEntity.task_out_columns()).where(TaskEntity.user_id == user_id)).all()
+    return [TaskEntity.row_to_task_out(row) for row in rows]
+
+def measure_cpu(engine, user_id: int, rows: int, path: Callable[[Session, int], list], repeat: int = 3) -> float:
+    timings: Final[list[float]] = []
+
+    for _ in range(repeat):
+        with Session(engine) as session:
+            gc.collect()
+            started = time.process_time()
+            result = path(session, user_id)
+            timings.append(time.process_time() - started)
+
+            assert len(result) == rows
+
+    return min(timings) / rows * 1_000_000
+
+def measure_memory(engine, user_id: int, rows: int, path: Callable[[Session, int], list]) -> float:
+    with Session(engine) as session:
+        gc.collect()
+        tracemalloc.start()
+
+        result: Final = path(session, user_id)
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(result) == rows
+
+    return peak / rows
+
+def main():
+    print(f"{'rows':>8} {'path':>10} {'cpu us/row':>12} {'peak B/row':>12}")
+
+    for rows in SIZES:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+
+        with Session(engine) as session:
+            user_id = seed(session, rows)
+
+        for name, path in [("orm", orm_path), ("projected", projected_path)]:
+            with Session(engine) as session:
+                path(session, user_id)
+
+            cpu = measure_cpu(engine, user_id, rows, path)
+            memory = measure_memory(engine, user_id, rows, path)
+            print(f"{rows:>8} {name:>10} {cpu:>12.2f} {memory:>12.0f}")
+
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
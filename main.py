@@ -5,8 +5,11 @@
 
 import logging
 from fastapi import FastAPI
-from api.controllers import auth_controller, user_controller, task_controller
+from api.controllers import auth_controller, user_controller, task_controller, metrics_controller
 from api.configs.db.database import create_tables
+from api.dependencies.service_dependency import NotAuthorizedError, not_authorized_handler
+from api.configs.crypto.password_pool import PasswordPoolFullError, password_pool_full_handler, password_pool
+from api.services.providers.provider_crypto_service import configure_password_hashing
 from contextlib import asynccontextmanager
 from typing import Final
 
@@ -21,8 +24,10 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up the application...")
     
     create_tables()
+    configure_password_hashing()
     yield
     logger.info("Shutting down the application...")
+    password_pool.shutdown()
 
 app: Final[FastAPI] = FastAPI(
     lifespan=lifespan, 
@@ -30,6 +35,11 @@ app: Final[FastAPI] = FastAPI(
     version="1.0.0"
     )
 
+app.add_exception_handler(NotAuthorizedError, not_authorized_handler)
+app.add_exception_handler(PasswordPoolFullError, password_pool_full_handler)
+
 app.include_router(task_controller.router)
 app.include_router(auth_controller.router)
-app.include_router(user_controller.router)
\ No newline at end of file
+app.include_router(user_controller.router)
+if metrics_controller.METRICS_ENABLED:
+    app.include_router(metrics_controller.router)
\ No newline at end of file
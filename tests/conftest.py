@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 from api.configs.db.database import Base, get_db
+from api.configs.cache.user_cache import user_cache
 import pytest
 
 from main import app
@@ -30,6 +31,8 @@ def db_session_fixture():
         db.close()
 
     Base.metadata.drop_all(bind=engine)
+    # ids start over with the next test's database
+    user_cache.clear()
 
 def override_get_db():
     db = TestingSessionLocal()
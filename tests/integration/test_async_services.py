@@ -0,0 +1,41 @@
+from typing import Final
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from api.configs.db.database import Base
+from api.models.schemas.user_schemas import CreateUserDTO
+from api.models.schemas.task_schemas import CreateTaskDTO
+from api.services.providers.provider_async_user_service import AsyncUserServiceProvider
+from api.services.providers.provider_async_task_service import AsyncTaskServiceProvider
+from api.utils.filters.task_filter import TaskFilter
+import asyncio
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+async def run_on_async_session():
+    engine: Final = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db:
+        user_service: Final = AsyncUserServiceProvider(db)
+        task_service: Final = AsyncTaskServiceProvider(db)
+
+        user: Final = await user_service.create(CreateUserDTO(name="async user", email="async@example.com", password="async-password"))
+        await task_service.create_many(user.id, [CreateTaskDTO(title=f"task {index}", is_done=index % 2 == 0, priority=2) for index in range(5)])
+
+        toggled: Final = await task_service.change_status_done_by_id_user_id(1, user.id)
+        stats: Final = await task_service.get_stats_user_id_filtered(user.id, TaskFilter())
+        exported: Final = [task.id async for task in task_service.stream_user_id_filtered(user.id, TaskFilter())]
+
+    await engine.dispose()
+
+    return toggled, stats, exported
+
+def test_async_services_run_the_sync_providers_over_an_async_session():
+    toggled, stats, exported = asyncio.run(run_on_async_session())
+
+    assert toggled.is_done == False
+    assert (stats.total, stats.done) == (5, 2)
+    assert exported == [1, 2, 3, 4, 5]
@@ -3,6 +3,8 @@ from fastapi.testclient import TestClient
 from httpx import Response
 from api.models.schemas.user_schemas import CreateUserDTO, LoginDTO
 import random
+import pytest
+from api.configs.db.database import ASYNC_DATABASE
 
 
 def test_login_user(client: TestClient):
@@ -63,4 +65,69 @@ def test_create_new_user(client: TestClient):
     assert response_data['status'] == True
     assert response_data['body']['token'] is not None
     assert response_data['body']['refresh_token'] is not None
-    assert response_data['datetime'] is not None
\ No newline at end of file
+    assert response_data['datetime'] is not None
+
+def test_register_writes_in_one_commit(client: TestClient):
+    from api.configs.db.unit_of_work import after_write_commit, write_commit_listeners
+
+    num: Final[int] = random.randint(1,1000000000)
+    commits: Final[list[set[int]]] = []
+
+    def count_commit(session, created_user_ids: set[int]):
+        commits.append(created_user_ids)
+
+    after_write_commit(count_commit)
+    try:
+        response_create: Final[Response] = client.post(
+            "/api/v1/auth/register",
+            json=dict(CreateUserDTO(name=f"user {num}", email=f"user{num}@example.com", password=str(num)))
+        )
+    finally:
+        write_commit_listeners.remove(count_commit)
+
+    assert response_create.status_code == 201
+    assert len(commits) == 1
+    assert len(commits[0]) == 1
+
+def test_login_sheds_load_when_the_password_pool_is_full(client: TestClient, monkeypatch):
+    from api.configs.crypto.password_pool import password_pool
+
+    num: Final[int] = random.randint(1,1000000000)
+    model: Final[Dict[str, Any]] = dict(CreateUserDTO(name=f"user {num}", email=f"user{num}@example.com", password=str(num)))
+
+    assert client.post("/api/v1/auth/register", json=model).status_code == 201
+
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+
+    response_login: Final[Response] = client.post(
+        "/api/v1/auth/login",
+        json=dict(LoginDTO(email=model['email'], password=model['password']))
+    )
+
+    assert response_login.status_code == 503
+    assert response_login.headers["retry-after"] == "1"
+    assert response_login.json()['status'] == False
+
+@pytest.mark.skipif(ASYNC_DATABASE, reason="db_session is the overridden sync database")
+def test_login_rehashes_a_password_with_an_outdated_cost(client: TestClient, db_session):
+    from passlib.hash import bcrypt
+    from sqlalchemy import update, select
+    from api.models.entities.user_entity import UserEntity
+    from api.services.providers import provider_crypto_service
+
+    num: Final[int] = random.randint(1,1000000000)
+    model: Final[Dict[str, Any]] = dict(CreateUserDTO(name=f"user {num}", email=f"user{num}@example.com", password=str(num)))
+
+    assert client.post("/api/v1/auth/register", json=model).status_code == 201
+
+    db_session.execute(update(UserEntity).where(UserEntity.email == model['email']).values(password=bcrypt.using(rounds=4).hash(model['password'])))
+    db_session.commit()
+
+    response_login: Final[Response] = client.post(
+        "/api/v1/auth/login",
+        json=dict(LoginDTO(email=model['email'], password=model['password']))
+    )
+
+    assert response_login.status_code == 200
+    rehashed: Final[str] = db_session.execute(select(UserEntity.password).where(UserEntity.email == model['email'])).scalar_one()
+    assert bcrypt.from_string(rehashed).rounds == provider_crypto_service.password_cost.rounds
@@ -0,0 +1,49 @@
+from typing import Dict, Final
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from api.configs.db.database import Base, get_replica_session, recent_writes
+from tests.integration.test_user_controller import create_user_return_token
+from main import app
+import pytest
+
+@pytest.fixture(name="replica_client")
+def replica_client_fixture(client: TestClient, tmp_path):
+    # a second, empty database stands in for a replica that hasn't caught up yet
+    replica_engine: Final[Engine] = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica_engine)
+    ReplicaSession: Final[sessionmaker[Session]] = sessionmaker(autoflush=False, bind=replica_engine)
+
+    def override_get_replica_session():
+        db = ReplicaSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_replica_session] = override_get_replica_session
+    yield client
+
+    recent_writes.clear()
+    replica_engine.dispose()
+
+def test_reads_stay_on_primary_within_the_write_window(replica_client: TestClient):
+    response_user: Final = create_user_return_token(replica_client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    task_id: Final[int] = replica_client.post("/api/v1/task", json={"title": "fresh task"}, headers=headers).json()['body']['id']
+
+    assert replica_client.get(f"/api/v1/task/{task_id}", headers=headers).status_code == 200
+    assert replica_client.get("/api/v1/user", headers=headers).status_code == 200
+
+def test_reads_go_to_the_replica_after_the_window(replica_client: TestClient):
+    response_user: Final = create_user_return_token(replica_client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    task_id: Final[int] = replica_client.post("/api/v1/task", json={"title": "lagging task"}, headers=headers).json()['body']['id']
+    recent_writes.clear()
+
+    assert replica_client.get(f"/api/v1/task/{task_id}", headers=headers).status_code == 404
+    assert replica_client.get("/api/v1/user", headers=headers).status_code == 404
+    assert replica_client.put(f"/api/v1/task/{task_id}", json={"title": "written on primary"}, headers=headers).status_code == 200
+    assert replica_client.get(f"/api/v1/task/{task_id}", headers=headers).json()['body']['title'] == "written on primary"
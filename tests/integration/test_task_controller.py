@@ -1,7 +1,13 @@
 from typing import Dict, Final
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from api.controllers import metrics_controller
+from api.dependencies.service_dependency import NotAuthorizedError, not_authorized_handler
 from api.models.schemas.task_schemas import CreateTaskDTO, UpdateTaskDTO
 import random
+import json
+import csv
+import io
 from tests.integration.test_user_controller import create_user_return_token
 
 def create_task(client: TestClient, token: str):
@@ -110,6 +116,535 @@ def test_get_all(client: TestClient):
     assert response_get_all_data['total'] == 11
     assert response_get_all_data['page'] == 1
 
+def test_get_all_after_user_deleted(client: TestClient):
+    headers: Final = {"Authorization": f"Bearer {create_user_return_token(client)['token']}"}
+
+    assert client.get("/api/v1/task", headers=headers).status_code == 200
+    assert client.delete("/api/v1/user", headers=headers).status_code == 200
+
+    response_get_all: Final = client.get("/api/v1/task", headers=headers)
+
+    assert response_get_all.status_code == 404
+    assert response_get_all.json()['message'] == "User not found"
+
+def test_get_all_paginated_in_database(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+
+    created_ids: Final[list[int]] = [create_task(client, response_user['token'])['body']['id'] for _ in range(7)]
+    create_task(client, other_user['token'])
+
+    response_get_all: Final = client.get(
+        "/api/v1/task",
+        params={"page": 2, "size": 3},
+        headers={"Authorization": f"Bearer {response_user['token']}"},
+    )
+
+    assert response_get_all.status_code == 200
+    response_get_all_data = response_get_all.json()
+
+    assert response_get_all_data['total'] == 7
+    assert response_get_all_data['page'] == 2
+    assert response_get_all_data['pages'] == 3
+    assert [item['id'] for item in response_get_all_data['items']] == created_ids[3:6]
+
+def test_get_all_cursor_pagination(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    created_ids: Final[list[int]] = [create_task(client, response_user['token'])['body']['id'] for _ in range(7)]
+
+    first_page: Final = client.get("/api/v1/task", params={"paging": "cursor", "size": 3}, headers=headers).json()
+
+    assert [item['id'] for item in first_page['items']] == created_ids[0:3]
+    assert first_page['previous_cursor'] is None
+    assert first_page['next_cursor'] is not None
+
+    second_page: Final = client.get(
+        "/api/v1/task",
+        params={"paging": "cursor", "size": 3, "cursor": first_page['next_cursor']},
+        headers=headers,
+    ).json()
+
+    assert [item['id'] for item in second_page['items']] == created_ids[3:6]
+
+    last_page: Final = client.get(
+        "/api/v1/task",
+        params={"paging": "cursor", "size": 3, "cursor": second_page['next_cursor']},
+        headers=headers,
+    ).json()
+
+    assert [item['id'] for item in last_page['items']] == created_ids[6:]
+    assert last_page['next_cursor'] is None
+
+    previous_page: Final = client.get(
+        "/api/v1/task",
+        params={"paging": "cursor", "size": 3, "cursor": second_page['previous_cursor']},
+        headers=headers,
+    ).json()
+
+    assert [item['id'] for item in previous_page['items']] == created_ids[0:3]
+    assert previous_page['previous_cursor'] is None
+
+def test_get_all_cursor_pagination_by_due_date_with_filter(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    for due_date, priority in [("2030-01-03", 5), (None, 5), ("2030-01-01", 5), ("2030-01-02", 1), (None, 5)]:
+        client.post(
+            "/api/v1/task",
+            json={"title": "task due", "due_date": due_date, "priority": priority},
+            headers=headers,
+        )
+
+    params: Final[Dict] = {"paging": "cursor", "sort_by": "due_date", "size": 2, "priority__gte": 2}
+    seen: Final[list] = []
+    cursor = None
+
+    while True:
+        page = client.get("/api/v1/task", params={**params, "cursor": cursor} if cursor else params, headers=headers).json()
+        seen.extend(item['due_date'] for item in page['items'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+
+    assert seen == ["2030-01-01", "2030-01-03", "None", "None"]
+
+def test_get_all_cursor_pagination_rejects_invalid_cursor(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+
+    response_get_all: Final = client.get(
+        "/api/v1/task",
+        params={"paging": "cursor", "cursor": "not-a-cursor"},
+        headers={"Authorization": f"Bearer {response_user['token']}"},
+    )
+
+    assert response_get_all.status_code == 400
+    assert response_get_all.json()['message'] == "Cursor invalid"
+
+def test_get_all_full_text_search(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    for title, description, priority in [
+        ("buy groceries", "milk, eggs and a long list of other things to remember", 2),
+        ("milk the cows", "milk every cow before sunrise", 2),
+        ("write report", "quarterly numbers", 2),
+        ("milk shake", "low priority milk", 1),
+    ]:
+        client.post("/api/v1/task", json={"title": title, "description": description, "priority": priority}, headers=headers)
+
+    client.post(
+        "/api/v1/task",
+        json={"title": "milk delivery", "description": "milk"},
+        headers={"Authorization": f"Bearer {other_user['token']}"},
+    )
+
+    response_search: Final = client.get("/api/v1/task", params={"q": "milk", "priority__gte": 2}, headers=headers)
+
+    assert response_search.status_code == 200
+    response_search_data: Final = response_search.json()
+
+    assert response_search_data['total'] == 2
+    assert [item['title'] for item in response_search_data['items']] == ["milk the cows", "buy groceries"]
+
+    client.put(
+        f"/api/v1/task/{response_search_data['items'][1]['id']}",
+        json={"description": "bread only"},
+        headers=headers,
+    )
+
+    response_after_update: Final = client.get("/api/v1/task", params={"q": "milk", "priority__gte": 2}, headers=headers).json()
+
+    assert [item['title'] for item in response_after_update['items']] == ["milk the cows"]
+
+def test_export_tasks_ndjson(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+
+    created_ids: Final[list[int]] = [create_task(client, response_user['token'])['body']['id'] for _ in range(3)]
+    create_task(client, other_user['token'])
+
+    response_export: Final = client.get(
+        "/api/v1/task/export",
+        headers={"Authorization": f"Bearer {response_user['token']}"},
+    )
+
+    assert response_export.status_code == 200
+    assert response_export.headers['content-type'].startswith("application/x-ndjson")
+
+    lines: Final[list] = [json.loads(line) for line in response_export.text.splitlines()]
+
+    assert [line['id'] for line in lines] == created_ids
+    assert all(line['user_id'] == lines[0]['user_id'] for line in lines)
+
+def test_export_tasks_csv_with_filter(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    client.post("/api/v1/task", json={"title": "task high", "priority": 9}, headers=headers)
+    client.post("/api/v1/task", json={"title": "task low", "priority": 1}, headers=headers)
+
+    response_export: Final = client.get(
+        "/api/v1/task/export",
+        params={"format": "csv", "priority__gte": 5},
+        headers=headers,
+    )
+
+    assert response_export.status_code == 200
+    assert response_export.headers['content-type'].startswith("text/csv")
+
+    rows: Final[list] = list(csv.DictReader(io.StringIO(response_export.text)))
+
+    assert [row['title'] for row in rows] == ["task high"]
+    assert rows[0]['priority'] == "9"
+
+def test_get_stats(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    for is_done, due_date, priority in [
+        (True, "2000-01-01", 1),
+        (False, "2000-01-01", 1),
+        (False, "2999-01-01", 3),
+        (False, None, 3),
+        (True, None, 5),
+    ]:
+        client.post("/api/v1/task", json={"title": "task stats", "is_done": is_done, "due_date": due_date, "priority": priority}, headers=headers)
+
+    create_task(client, other_user['token'])
+
+    response_stats: Final = client.get("/api/v1/task/stats", headers=headers)
+
+    assert response_stats.status_code == 200
+    assert response_stats.json()['body'] == {
+        "total": 5,
+        "done": 2,
+        "pending": 3,
+        "overdue": 1,
+        "by_priority": {"1": 2, "3": 2, "5": 1},
+    }
+
+    response_filtered: Final = client.get("/api/v1/task/stats", params={"priority__gte": 3}, headers=headers)
+
+    assert response_filtered.json()['body']['total'] == 3
+    assert response_filtered.json()['body']['overdue'] == 0
+
+def test_counters_follow_task_mutations(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    def assert_counters_match_tasks():
+        from_counters = client.get("/api/v1/task/stats", headers=headers).json()['body']
+        from_tasks = client.get("/api/v1/task/stats", params={"priority__gte": 0}, headers=headers).json()['body']
+
+        assert from_counters == from_tasks
+        assert client.get("/api/v1/task", headers=headers).json()['total'] == from_tasks['total']
+
+    first: Final = client.post("/api/v1/task", json={"title": "task one", "due_date": "2000-01-01", "priority": 2}, headers=headers).json()
+    second: Final = client.post("/api/v1/task", json={"title": "task two", "priority": 4}, headers=headers).json()
+    assert_counters_match_tasks()
+
+    client.put(f"/api/v1/task/{first['body']['id']}/toggle/status/is_done", headers=headers)
+    assert_counters_match_tasks()
+
+    client.put(f"/api/v1/task/{second['body']['id']}", json={"priority": 2, "due_date": "2000-01-01"}, headers=headers)
+    assert_counters_match_tasks()
+
+    client.delete(f"/api/v1/task/{first['body']['id']}", headers=headers)
+    assert_counters_match_tasks()
+
+    assert client.get("/api/v1/task/stats", headers=headers).json()['body'] == {
+        "total": 1,
+        "done": 0,
+        "pending": 1,
+        "overdue": 1,
+        "by_priority": {"2": 1},
+    }
+
+def test_get_task_conditional(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+    response_task: Final = create_task(client, response_user['token'])
+    url: Final[str] = f"/api/v1/task/{response_task['body']['id']}"
+
+    response_get: Final = client.get(url, headers=headers)
+    etag: Final[str] = response_get.headers['etag']
+
+    response_not_modified: Final = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    assert response_not_modified.status_code == 304
+    assert response_not_modified.content == b""
+
+    client.put(f"{url}/toggle/status/is_done", headers=headers)
+
+    response_modified: Final = client.get(url, headers={**headers, "If-None-Match": etag})
+
+    assert response_modified.status_code == 200
+    assert response_modified.headers['etag'] != etag
+
+def test_get_all_conditional(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+    response_task: Final = create_task(client, response_user['token'])
+
+    response_get_all: Final = client.get("/api/v1/task", headers=headers)
+    etag: Final[str] = response_get_all.headers['etag']
+
+    assert client.get("/api/v1/task", headers={**headers, "If-None-Match": etag}).status_code == 304
+    assert client.get("/api/v1/task", params={"size": 5}, headers={**headers, "If-None-Match": etag}).status_code == 200
+
+    client.put(f"/api/v1/task/{response_task['body']['id']}", json={"title": "renamed task"}, headers=headers)
+
+    response_after_update: Final = client.get("/api/v1/task", headers={**headers, "If-None-Match": etag})
+
+    assert response_after_update.status_code == 200
+    assert response_after_update.json()['items'][0]['title'] == "renamed task"
+
+def test_get_changes_with_tombstones(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    first: Final = create_task(client, response_user['token'])['body']['id']
+    second: Final = create_task(client, response_user['token'])['body']['id']
+    third: Final = create_task(client, response_user['token'])['body']['id']
+    create_task(client, other_user['token'])
+
+    full_sync: Final = client.get("/api/v1/task/changes", params={"limit": 2}, headers=headers).json()['body']
+
+    assert [change['task_id'] for change in full_sync['changes']] == [first, second]
+    assert full_sync['has_more'] == True
+
+    rest: Final = client.get("/api/v1/task/changes", params={"since": full_sync['next_cursor']}, headers=headers).json()['body']
+
+    assert [change['task_id'] for change in rest['changes']] == [third]
+    assert rest['has_more'] == False
+
+    client.delete(f"/api/v1/task/{second}", headers=headers)
+
+    delta: Final = client.get("/api/v1/task/changes", params={"since": rest['next_cursor']}, headers=headers).json()['body']
+
+    assert [(change['type'], change['task_id']) for change in delta['changes']] == [("delete", second)]
+    assert delta['changes'][0]['task'] is None
+
+    empty: Final = client.get("/api/v1/task/changes", params={"since": delta['next_cursor']}, headers=headers).json()['body']
+
+    assert empty['changes'] == []
+
+    after_delete_full_sync: Final = client.get("/api/v1/task/changes", headers=headers).json()['body']
+
+    assert [change['task_id'] for change in after_delete_full_sync['changes']] == [first, third]
+
+def test_get_changes_returns_an_update_of_a_lower_id_after_a_sync(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    first: Final = create_task(client, response_user['token'])['body']['id']
+    create_task(client, response_user['token'])
+
+    sync: Final = client.get("/api/v1/task/changes", headers=headers).json()['body']
+
+    # same second as the sync, and a lower id than its last task
+    client.put(f"/api/v1/task/{first}", json={"title": "renamed task"}, headers=headers)
+
+    delta: Final = client.get("/api/v1/task/changes", params={"since": sync['next_cursor']}, headers=headers).json()['body']
+
+    assert [(change['type'], change['task_id']) for change in delta['changes']] == [("upsert", first)]
+    assert delta['changes'][0]['task']['title'] == "renamed task"
+
+def test_create_batch(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    response_batch: Final = client.post(
+        "/api/v1/task/batch",
+        json=[
+            {"title": "batch one", "priority": 2},
+            {"title": "no"},
+            {"title": "batch three", "is_done": True, "due_date": "2030-01-01"},
+        ],
+        headers=headers,
+    )
+
+    assert response_batch.status_code == 201
+
+    body: Final = response_batch.json()['body']
+
+    assert [task['title'] for task in body['created']] == ["batch one", "batch three"]
+    assert body['created'][1]['is_done'] == True
+    assert [error['index'] for error in body['errors']] == [1]
+    assert body['errors'][0]['errors'][0]['loc'] == ["title"]
+
+    response_stats: Final = client.get("/api/v1/task/stats", headers=headers).json()['body']
+
+    assert response_stats['total'] == 2
+    assert response_stats['done'] == 1
+
+def test_create_batch_all_invalid(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+
+    response_batch: Final = client.post(
+        "/api/v1/task/batch",
+        json=[{"title": "no"}],
+        headers={"Authorization": f"Bearer {response_user['token']}"},
+    )
+
+    assert response_batch.status_code == 422
+    assert response_batch.json()['body']['created'] == []
+
+def test_delete_batch_by_filter(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    ids: Final[list[int]] = [create_task(client, response_user['token'])['body']['id'] for _ in range(3)]
+    create_task(client, other_user['token'])
+    client.patch("/api/v1/task/batch", json={"ids": ids[2:], "patch": {"is_done": False}}, headers=headers)
+    sync_cursor: Final = client.get("/api/v1/task/changes", headers=headers).json()['body']['next_cursor']
+
+    response_delete: Final = client.delete("/api/v1/task/batch", params={"is_done": True}, headers=headers)
+
+    assert response_delete.status_code == 200
+    assert response_delete.json()['body'] == {"deleted": 2}
+
+    stats: Final = client.get("/api/v1/task/stats", headers=headers).json()['body']
+    other_stats: Final = client.get("/api/v1/task/stats", headers={"Authorization": f"Bearer {other_user['token']}"}).json()['body']
+
+    assert (stats['total'], stats['done']) == (1, 0)
+    assert (other_stats['total'], other_stats['done']) == (1, 1)
+
+    changes: Final = client.get("/api/v1/task/changes", params={"since": sync_cursor}, headers=headers).json()['body']['changes']
+
+    assert sorted(change['task_id'] for change in changes if change['type'] == "delete") == ids[:2]
+
+def test_delete_batch_streams_ids(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    ids: Final[list[int]] = [create_task(client, response_user['token'])['body']['id'] for _ in range(2)]
+
+    response_delete: Final = client.delete("/api/v1/task/batch", params={"ids": ids + [0], "stream_ids": True}, headers=headers)
+
+    assert response_delete.status_code == 200
+    assert response_delete.headers["X-Deleted-Count"] == "2"
+    assert [int(line) for line in response_delete.text.splitlines()] == ids
+
+def test_delete_batch_requires_ids_or_filter(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+
+    response_delete: Final = client.delete("/api/v1/task/batch", headers={"Authorization": f"Bearer {response_user['token']}"})
+
+    assert response_delete.status_code == 400
+
+def test_read_and_delete_are_scoped_to_the_owner(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    other_headers: Final[Dict] = {"Authorization": f"Bearer {other_user['token']}"}
+
+    task_id: Final[int] = create_task(client, response_user['token'])['body']['id']
+
+    assert client.get(f"/api/v1/task/{task_id}", headers=other_headers).status_code == 404
+    assert client.delete(f"/api/v1/task/{task_id}", headers=other_headers).status_code == 404
+    assert client.get(f"/api/v1/task/{task_id}", headers={"Authorization": f"Bearer {response_user['token']}"}).status_code == 200
+
+def test_update_and_toggle_are_scoped_to_the_owner(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    task_id: Final[int] = create_task(client, response_user['token'])['body']['id']
+    other_headers: Final[Dict] = {"Authorization": f"Bearer {other_user['token']}"}
+
+    assert client.put(f"/api/v1/task/{task_id}/toggle/status/is_done", headers=other_headers).status_code == 404
+    assert client.put(f"/api/v1/task/{task_id}", json={"priority": 9}, headers=other_headers).status_code == 404
+
+    response_put: Final = client.put(f"/api/v1/task/{task_id}", json={"priority": 9, "due_date": "2030-01-01"}, headers=headers)
+    response_toggle: Final = client.put(f"/api/v1/task/{task_id}/toggle/status/is_done", headers=headers)
+
+    assert response_put.json()['body']['priority'] == 9
+    assert response_toggle.json()['body']['is_done'] == False
+
+    from_counters: Final = client.get("/api/v1/task/stats", headers=headers).json()['body']
+    from_tasks: Final = client.get("/api/v1/task/stats", params={"priority__gte": 0}, headers=headers).json()['body']
+
+    assert from_counters == from_tasks
+    assert from_counters['by_priority'] == {"9": 1}
+
+def test_update_batch_by_ids_and_toggle(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    other_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    ids: Final[list[int]] = [create_task(client, response_user['token'])['body']['id'] for _ in range(3)]
+    foreign_id: Final[int] = create_task(client, other_user['token'])['body']['id']
+
+    response_patch: Final = client.patch(
+        "/api/v1/task/batch",
+        json={"ids": [ids[0], ids[1], foreign_id], "patch": {"priority": 8}, "toggle_is_done": True},
+        headers=headers,
+    )
+
+    assert response_patch.status_code == 200
+
+    body: Final = response_patch.json()['body']
+
+    assert sorted(task['id'] for task in body) == ids[:2]
+    assert all(task['priority'] == 8 and task['is_done'] == False for task in body)
+
+    foreign_task: Final = client.get(f"/api/v1/task/{foreign_id}", headers={"Authorization": f"Bearer {other_user['token']}"}).json()['body']
+
+    assert foreign_task['priority'] == 3
+
+    from_counters: Final = client.get("/api/v1/task/stats", headers=headers).json()['body']
+    from_tasks: Final = client.get("/api/v1/task/stats", params={"priority__gte": 0}, headers=headers).json()['body']
+
+    assert from_counters == from_tasks
+    assert from_counters['by_priority'] == {"3": 1, "8": 2}
+
+def test_update_batch_by_filter(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    for priority in [1, 5, 9]:
+        client.post("/api/v1/task", json={"title": "filtered task", "priority": priority}, headers=headers)
+
+    response_patch: Final = client.patch(
+        "/api/v1/task/batch",
+        params={"priority__gte": 5},
+        json={"patch": {"is_done": True}},
+        headers=headers,
+    )
+
+    assert response_patch.status_code == 200
+    assert sorted(task['priority'] for task in response_patch.json()['body']) == [5, 9]
+    assert client.get("/api/v1/task/stats", headers=headers).json()['body']['done'] == 2
+
+def test_update_batch_requires_a_change(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+
+    response_patch: Final = client.patch(
+        "/api/v1/task/batch",
+        json={"ids": [1]},
+        headers={"Authorization": f"Bearer {response_user['token']}"},
+    )
+
+    assert response_patch.status_code == 400
+
+def test_update_batch_requires_ids_or_a_filter(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+    headers: Final[Dict] = {"Authorization": f"Bearer {response_user['token']}"}
+
+    client.post("/api/v1/task", json={"title": "pending task", "is_done": False}, headers=headers)
+
+    response_patch: Final = client.patch("/api/v1/task/batch", json={"patch": {"is_done": True}}, headers=headers)
+
+    assert response_patch.status_code == 400
+    assert response_patch.json()['message'] == "Send ids or at least one filter"
+    assert client.get("/api/v1/task/stats", headers=headers).json()['body']['done'] == 0
+
 def test_create_task(client: TestClient):
     response_user: Final = create_user_return_token(client)
 
@@ -287,6 +822,19 @@ def test_update_task(client: TestClient):
     assert response_post_data['body']['description'] == dto.description
     assert response_post_data['body']['priority'] == dto.priority
     
+def test_put_rejects_priority_zero(client: TestClient):
+    response_user: Final = create_user_return_token(client)
+
+    response_task: Final = create_task(client, response_user['token'])
+
+    response_put: Final = client.put(
+        f"/api/v1/task/{response_task['body']['id']}",
+        headers={"Authorization": f"Bearer {response_user['token']}"},
+        json={"priority": 0}
+    )
+
+    assert response_put.status_code == 422
+
 def test_put_return_404_update_task(client: TestClient):
     response_user: Final = create_user_return_token(client)
 
@@ -340,3 +888,30 @@ def test_return_bad_request_update_task(client: TestClient):
     assert response_post_data['message'] == "Task Id is required"
     assert response_post_data['status'] == False
     assert response_post_data['body'] is None
+
+def test_get_all_documents_both_page_shapes(client: TestClient):
+    get_all: Final[Dict] = client.get("/openapi.json").json()['paths']['/api/v1/task']['get']
+    schema: Final[Dict] = get_all['responses']['200']['content']['application/json']['schema']
+
+    assert [ref['$ref'].rsplit("/", 1)[-1] for ref in schema['anyOf']] == ["Page_TaskOUT_", "TaskCursorPage"]
+    assert {"page", "size", "paging", "cursor"} <= {param['name'] for param in get_all['parameters']}
+
+def test_pool_metrics(client: TestClient, monkeypatch):
+    response_user: Final = create_user_return_token(client)
+    monkeypatch.setattr(metrics_controller, "METRICS_TOKEN", "operator-token")
+
+    # mounted only with METRICS_TOKEN, so the router is served from its own app here
+    metrics_app: Final[FastAPI] = FastAPI()
+    metrics_app.add_exception_handler(NotAuthorizedError, not_authorized_handler)
+    metrics_app.include_router(metrics_controller.router)
+    metrics_client: Final[TestClient] = TestClient(metrics_app)
+
+    assert client.get("/api/v1/metrics/pool").status_code == 404
+    assert metrics_client.get("/api/v1/metrics/pool").status_code == 401
+    assert metrics_client.get("/api/v1/metrics/pool", headers={"Authorization": f"Bearer {response_user['token']}"}).status_code == 401
+    assert metrics_client.get("/api/v1/metrics/password", headers={"X-Metrics-Token": "wrong-token"}).status_code == 401
+
+    response: Final = metrics_client.get("/api/v1/metrics/pool", headers={"X-Metrics-Token": "operator-token"})
+
+    assert response.status_code == 200
+    assert "checked_out" in response.json()['body']['sync']
@@ -0,0 +1,50 @@
+from typing import Final
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from api.models.entities.user_entity import UserEntity
+from api.models.entities.task_entity import TaskEntity
+from api.models.entities.task_counter_entity import TaskCounterEntity, NO_PRIORITY
+from api.repositories.providers.provider_task_repository import TaskRepositoryProvider
+
+def test_rebuild_counters_recomputes_from_tasks(db_session: Session):
+    user: Final[UserEntity] = UserEntity(name="counter user", email="counter@example.com", password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    db_session.add_all([
+        TaskEntity(title="task a", is_done=True, priority=3, user_id=user.id),
+        TaskEntity(title="task b", is_done=False, priority=3, due_date=date(2030, 1, 1), user_id=user.id),
+        TaskEntity(title="task c", is_done=False, priority=None, user_id=user.id),
+    ])
+    db_session.add(TaskCounterEntity(user_id=user.id, priority=9, total=42, done=0, dated_pending=0))
+    db_session.commit()
+
+    TaskRepositoryProvider(db_session).rebuild_counters(user.id)
+
+    counters: Final = {
+        counter.priority: (counter.total, counter.done, counter.dated_pending)
+        for counter in db_session.execute(select(TaskCounterEntity).where(TaskCounterEntity.user_id == user.id)).scalars()
+    }
+
+    assert counters == {3: (2, 1, 1), NO_PRIORITY: (1, 0, 0)}
+
+def test_rebuild_counters_keeps_the_revision_growing(db_session: Session):
+    user: Final[UserEntity] = UserEntity(name="revision user", email="revision@example.com", password="x")
+    db_session.add(user)
+    db_session.flush()
+
+    db_session.add(TaskEntity(title="task a", is_done=False, priority=3, user_id=user.id))
+    db_session.add(TaskCounterEntity(user_id=user.id, priority=3, total=5, done=0, dated_pending=0, revision=7))
+    db_session.commit()
+
+    repository: Final[TaskRepositoryProvider] = TaskRepositoryProvider(db_session)
+    before: Final[int] = repository.get_watermark_user_id(user.id).revision
+
+    repository.rebuild_counters(user.id)
+    db_session.commit()
+
+    watermark: Final = repository.get_watermark_user_id(user.id)
+
+    assert watermark.revision > before
+    assert watermark.total == 1
@@ -0,0 +1,53 @@
+from typing import Any, Dict, Final
+from datetime import date, datetime
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from api.models.entities.task_entity import TaskEntity
+from api.utils.filters.task_filter import TaskFilter
+import pytest
+
+FILTER_SHAPES: Final[list[Dict[str, Any]]] = [
+    {},
+    {"title__ilike": "task"},
+    {"description__ilike": "task"},
+    {"is_done": True},
+    {"is_done": False, "due_date__lte": date(2030, 1, 1)},
+    {"priority__gte": 3},
+    {"priority__lte": 7},
+    {"priority__gte": 3, "priority__lte": 7},
+    {"created_at__gte": datetime(2030, 1, 1)},
+    {"created_at__lte": datetime(2030, 1, 1)},
+    {"due_date__gte": date(2030, 1, 1)},
+    {"due_date__lte": date(2030, 1, 1)},
+    {"is_done": False, "priority__gte": 5, "due_date__gte": date(2030, 1, 1)},
+]
+
+ORDERINGS: Final[Dict[str, tuple]] = {
+    "created_at": (TaskEntity.created_at, TaskEntity.id),
+    "due_date": (TaskEntity.due_date, TaskEntity.id),
+}
+
+def explain(db_session: Session, stmt) -> list[str]:
+    sql: Final[str] = str(stmt.compile(bind=db_session.get_bind(), compile_kwargs={"literal_binds": True}))
+    rows: Final = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+
+    return [row[-1] for row in rows]
+
+@pytest.mark.parametrize("ordering", ORDERINGS.keys())
+@pytest.mark.parametrize("shape", FILTER_SHAPES, ids=lambda shape: ",".join(shape) or "no-filter")
+def test_task_filter_shapes_use_an_index(db_session: Session, shape: Dict[str, Any], ordering: str):
+    stmt = select(TaskEntity).where(TaskEntity.user_id == 1)
+    stmt = TaskFilter(**shape).filter(stmt).order_by(*ORDERINGS[ordering])
+
+    plan: Final[list[str]] = explain(db_session, stmt)
+    task_steps: Final[list[str]] = [step for step in plan if " tasks" in step]
+
+    assert task_steps, plan
+    assert all(step.startswith("SEARCH tasks USING") for step in task_steps), plan
+
+def test_ownership_scoped_lookup_uses_an_index(db_session: Session):
+    stmt = select(TaskEntity).where(TaskEntity.id == 1, TaskEntity.user_id == 1)
+
+    plan: Final[list[str]] = explain(db_session, stmt)
+
+    assert all(step.startswith("SEARCH tasks USING") for step in plan), plan
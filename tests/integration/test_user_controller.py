@@ -1,7 +1,10 @@
 from typing import Any, Dict, Final
 from fastapi.testclient import TestClient
 from httpx import Response
+from sqlalchemy.orm import Session
 from api.models.schemas.user_schemas import CreateUserDTO, UpdateUserDTO, LoginDTO
+from api.models.entities.user_entity import UserEntity
+from api.configs.cache.user_cache import user_cache
 import random
 
 def create_user_return_token(client: TestClient):
@@ -87,4 +90,68 @@ def test_delete_user(client: TestClient):
     assert response_get_data['code'] == 200
     assert response_get_data['message'] == "See you later"
     assert response_get_data['status'] == True
-    assert response_get_data['body'] is None
\ No newline at end of file
+    assert response_get_data['body'] is None
+def test_get_user_with_invalid_token_is_unauthorized(client: TestClient):
+    response_get: Final[Response] = client.get(
+        "/api/v1/user",
+        headers={"Authorization": "Bearer not-a-token"},
+    )
+
+    assert response_get.status_code == 401
+    assert response_get.json()['message'] == "You are not authorized"
+    assert client.get("/api/v1/user").status_code == 401
+
+def test_token_is_decoded_once_per_request(client: TestClient):
+    from main import app
+    from api.dependencies.service_dependency import get_jwt_service
+    from api.services.providers.provider_jwt_service import JwtServiceProvider
+
+    response: Final = create_user_return_token(client)
+    decoded: Final[list[str]] = []
+
+    class CountingJwtService(JwtServiceProvider):
+        def decode_token(self, token: str) -> dict | None:
+            decoded.append(token)
+            return super().decode_token(token)
+
+    app.dependency_overrides[get_jwt_service] = CountingJwtService
+
+    response_get: Final[Response] = client.get(
+        "/api/v1/user",
+        headers={"Authorization": f"Bearer {response['token']}"},
+    )
+
+    del app.dependency_overrides[get_jwt_service]
+
+    assert response_get.status_code == 200
+    assert decoded == [response['token']]
+
+def test_deleted_user_is_dropped_from_the_cache_after_the_commit(db_session: Session):
+    user: Final[UserEntity] = UserEntity(name="cached user", email="cached@example.com", password="hash")
+    db_session.add(user)
+    db_session.commit()
+
+    db_session.delete(user)
+    db_session.flush()
+
+    # a concurrent request still sees the uncommitted row and caches the user again
+    user_cache.add(user.id)
+    assert user_cache.contains(user.id)
+
+    db_session.commit()
+
+    assert not user_cache.contains(user.id)
+
+def test_rolled_back_delete_keeps_the_cached_user(db_session: Session):
+    user: Final[UserEntity] = UserEntity(name="kept user", email="kept@example.com", password="hash")
+    db_session.add(user)
+    db_session.commit()
+    user_cache.add(user.id)
+
+    db_session.delete(user)
+    db_session.flush()
+    db_session.rollback()
+    db_session.commit()
+
+    assert user_cache.contains(user.id)
+    assert "deleted_user_ids" not in db_session.info
@@ -0,0 +1,48 @@
+from typing import Final
+from passlib.hash import bcrypt
+from api.services.providers import provider_crypto_service
+from api.services.providers.provider_crypto_service import (
+    calibrate_password_rounds, set_password_rounds, verify_and_update_password, MIN_ROUNDS, MAX_ROUNDS
+)
+
+def test_calibration_stays_within_bounds():
+    assert calibrate_password_rounds(0.000001)[0] == MIN_ROUNDS
+    assert calibrate_password_rounds(10_000)[0] == MAX_ROUNDS
+
+def test_calibration_estimate_is_the_probe_scaled_by_rounds():
+    rounds, estimated = calibrate_password_rounds(0.25)
+
+    assert MIN_ROUNDS <= rounds <= MAX_ROUNDS
+    assert estimated > 0
+
+def test_calibration_rounds_down(monkeypatch):
+    clock: Final[list[float]] = [0.0]
+
+    def perf_counter() -> float:
+        clock[0] += 0.005
+        return clock[0]
+
+    monkeypatch.setattr(provider_crypto_service.time, "perf_counter", perf_counter)
+
+    # 4.9 doublings of the 5ms probe away from the target
+    assert calibrate_password_rounds(0.005 * 2 ** 4.9)[0] == 12
+
+def test_login_hash_with_a_lower_cost_is_upgraded(monkeypatch):
+    monkeypatch.setattr(provider_crypto_service, "pwd_context", provider_crypto_service.pwd_context.copy())
+    set_password_rounds(MIN_ROUNDS)
+
+    old_hash: Final[str] = bcrypt.using(rounds=4).hash("secret-password")
+    valid, new_hash = verify_and_update_password("secret-password", old_hash)
+
+    assert valid == True
+    assert new_hash is not None and bcrypt.from_string(new_hash).rounds == MIN_ROUNDS
+    assert verify_and_update_password("secret-password", new_hash) == (True, None)
+    assert verify_and_update_password("wrong-password", old_hash) == (False, None)
+
+def test_login_hash_with_a_higher_cost_is_kept(monkeypatch):
+    monkeypatch.setattr(provider_crypto_service, "pwd_context", provider_crypto_service.pwd_context.copy())
+    set_password_rounds(MIN_ROUNDS)
+
+    stronger_hash: Final[str] = bcrypt.using(rounds=MIN_ROUNDS + 1).hash("secret-password")
+
+    assert verify_and_update_password("secret-password", stronger_hash) == (True, None)
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import pytest
+from typing import Final
+from api.configs.crypto.password_pool import PasswordPool, PasswordPoolFullError
+
+def test_calls_past_max_pending_are_rejected():
+    pool: Final[PasswordPool] = PasswordPool(workers=1, max_pending=2, kind="thread")
+    release: Final[threading.Event] = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordPoolFullError):
+            await pool.run(release.wait)
+
+        release.set()
+        return await asyncio.gather(*running)
+
+    assert asyncio.run(scenario()) == [True, True]
+    assert (pool.pending, pool.rejected) == (0, 1)
+    pool.shutdown()
+
+def test_process_pool_hashes_and_verifies():
+    from api.services.providers.provider_crypto_service import hash_password, verify_password
+
+    pool: Final[PasswordPool] = PasswordPool(workers=1, max_pending=4)
+
+    async def scenario():
+        hashed = await pool.run(hash_password, "secret-password")
+        return await pool.run(verify_password, "secret-password", hashed)
+
+    assert asyncio.run(scenario()) == True
+    pool.shutdown()
+
+def test_process_pool_does_not_fork_the_server():
+    pool: Final[PasswordPool] = PasswordPool(workers=1, max_pending=4)
+
+    assert pool._get_executor(print)._mp_context.get_start_method() in ("forkserver", "spawn")
+    pool.shutdown()
@@ -0,0 +1,40 @@
+from typing import Final
+from sqlalchemy import create_engine, make_url
+from api.configs.db.pool import PoolSettings, TimedQueuePool, TimedAsyncAdaptedQueuePool, engine_options, pool_metrics
+
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("DB_SIZE", "20")
+    monkeypatch.setenv("DB_PRE_PING", "false")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+
+    settings: Final[PoolSettings] = PoolSettings.from_env()
+
+    assert (settings.size, settings.pre_ping, settings.statement_timeout_ms, settings.echo) == (20, False, 5000, False)
+
+def test_engine_options_for_postgres_drivers():
+    settings: Final[PoolSettings] = PoolSettings(size=20, max_overflow=0, statement_timeout_ms=5000)
+
+    sync_options: Final = engine_options(make_url("postgresql://u:p@db/app"), settings)
+    async_options: Final = engine_options(make_url("postgresql+asyncpg://u:p@db/app"), settings)
+
+    assert sync_options["poolclass"] is TimedQueuePool
+    assert (sync_options["pool_size"], sync_options["max_overflow"]) == (20, 0)
+    assert sync_options["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert async_options["poolclass"] is TimedAsyncAdaptedQueuePool
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+def test_engine_options_keep_the_default_pool_for_memory_sqlite():
+    assert engine_options(make_url("sqlite://"), PoolSettings()) == {"echo": False, "pool_pre_ping": True}
+
+def test_pool_metrics_track_checkouts(tmp_path):
+    url: Final = make_url(f"sqlite:///{tmp_path / 'pool.db'}")
+    engine: Final = create_engine(url, **engine_options(url, PoolSettings(size=2)))
+
+    with engine.connect():
+        metrics: Final = pool_metrics(engine.pool)
+
+    assert metrics["checked_out"] == 1
+    assert metrics["checkouts"] == 1
+    assert pool_metrics(engine.pool)["checked_out"] == 0
+
+    engine.dispose()
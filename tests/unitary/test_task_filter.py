@@ -0,0 +1,41 @@
+from typing import Final
+from datetime import date, datetime
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.dialects import sqlite
+from api.models.entities.task_entity import TaskEntity
+from api.models.entities.user_entity import UserEntity
+from api.utils.filters.task_filter import TaskFilter
+
+def task_ids():
+    return lambda_stmt(lambda: select(TaskEntity.id))
+
+def rendered(stmt) -> str:
+    return str(stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+def test_filter_lambda_matches_filter_for_every_field():
+    values: Final[dict] = dict(
+        title__ilike = "%milk%",
+        description__ilike = "%buy%",
+        is_done = False,
+        priority__gte = 2,
+        priority__lte = 8,
+        created_at__gte = datetime(2024, 1, 1),
+        created_at__lte = datetime(2024, 12, 31),
+        due_date__gte = date(2024, 1, 1),
+        due_date__lte = date(2024, 12, 31),
+    )
+    assert set(values) == set(TaskFilter.model_fields)
+
+    for field, value in values.items():
+        filters = TaskFilter(**{field: value})
+
+        assert rendered(filters.filter_lambda(task_ids())) == rendered(filters.filter(select(TaskEntity.id)))
+
+def test_filter_lambda_reuses_the_statement_for_the_same_shape():
+    first: Final = TaskFilter(is_done=True, priority__gte=2).filter_lambda(task_ids())
+    second: Final = TaskFilter(is_done=False, priority__gte=7).filter_lambda(task_ids())
+    other_shape: Final = TaskFilter(is_done=True).filter_lambda(task_ids())
+
+    assert first._generate_cache_key().key == second._generate_cache_key().key
+    assert first._generate_cache_key().key != other_shape._generate_cache_key().key
+    assert second.compile().params == {"is_done_1": False, "priority_gte_1": 7}
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock
 from api.models.entities.task_entity import TaskEntity
 from api.services.providers.provider_task_service import TaskServiceProvider
 from api.models.entities.user_entity import UserEntity
-from api.models.schemas.task_schemas import CreateTaskDTO, UpdateTaskDTO
+from api.models.schemas.task_schemas import BulkUpdateTaskDTO, CreateTaskDTO, UpdateTaskDTO
 from datetime import datetime, date
 from typing import Final
 import copy
@@ -81,12 +81,65 @@ def test_task_return_null_when_pass_id_zero(task_service, mock_task_repository):
 
     assert mock_task_repository.get_by_id.call_count == 0
 
+def test_get_page_user_id_filtered(task_service, mock_task_repository):
+    page: Final = MagicMock()
+    filters: Final = MagicMock()
+    mock_task_repository.get_page_user_id_filtered.return_value = page
+
+    result: Final = task_service.get_page_user_id_filtered(mock_user.id, filters)
+
+    assert result is page
+
+    mock_task_repository.get_page_user_id_filtered.assert_called_once_with(mock_user.id, filters, None)
+
+def test_get_page_user_id_filtered_ignores_blank_search(task_service, mock_task_repository):
+    filters: Final = MagicMock()
+
+    task_service.get_page_user_id_filtered(mock_user.id, filters, "   ")
+
+    mock_task_repository.get_page_user_id_filtered.assert_called_once_with(mock_user.id, filters, None)
+
+def test_get_with_etag_by_id_user_id(task_service, mock_task_repository, mock_task_entity):
+    mock_task_entity.revision = 3
+    mock_task_repository.get_with_revision_by_id_user_id.return_value = mock_task_entity
+
+    task_out, etag = task_service.get_with_etag_by_id_user_id(1, mock_user.id)
+
+    assert task_out.id == 1
+    assert etag.startswith('W/"')
+    mock_task_repository.get_with_revision_by_id_user_id.assert_called_once_with(1, mock_user.id)
+
+def test_get_with_etag_by_id_user_id_hides_other_users_tasks(task_service, mock_task_repository):
+    mock_task_repository.get_with_revision_by_id_user_id.return_value = None
+
+    assert task_service.get_with_etag_by_id_user_id(1, mock_user.id + 1) is None
+    assert task_service.get_by_id_user_id(0, mock_user.id) is None
+
+def test_get_list_etag_changes_with_revision(task_service, mock_task_repository):
+    mock_task_repository.get_watermark_user_id.return_value = MagicMock(revision=1, total=2, updated_at=None)
+    before: Final[str] = task_service.get_list_etag(mock_user.id, "page=1")
+
+    mock_task_repository.get_watermark_user_id.return_value = MagicMock(revision=2, total=2, updated_at=None)
+
+    assert task_service.get_list_etag(mock_user.id, "page=1") != before
+
 def test_delete_task(task_service, mock_task_repository):
-    mock_task_repository.delete.return_value = None
+    mock_task_repository.delete_many_user_id.return_value = [
+        MagicMock(id=mock_task.id, priority=1, is_done=False, due_date=None)
+    ]
+
+    assert task_service.delete_by_id_user_id(mock_task.id, mock_user.id) is True
+
+    mock_task_repository.delete_many_user_id.assert_called_once()
+    assert mock_task_repository.delete_many_user_id.call_args.args[:2] == (mock_user.id, [mock_task.id])
+    mock_task_repository.apply_counter_delta.assert_called_once_with(mock_user.id, 1, -1, 0, 0, revision=1)
 
-    task_service.delete(mock_task)
+def test_delete_task_not_found_leaves_counters(task_service, mock_task_repository):
+    mock_task_repository.delete_many_user_id.return_value = []
 
-    mock_task_repository.delete.assert_called_once_with(mock_task)
+    assert task_service.delete_by_id_user_id(mock_task.id, mock_user.id) is False
+
+    mock_task_repository.apply_counter_delta.assert_not_called()
 
 def test_create_task(task_service, mock_task_repository):
     mock_task_repository.create.return_value = mock_task
@@ -99,7 +152,7 @@ def test_create_task(task_service, mock_task_repository):
         priority = mock_task.priority,
     )
 
-    result: Final[TaskEntity] = task_service.create(mock_user, dto)
+    result: Final[TaskEntity] = task_service.create(mock_user.id, dto)
 
     assert result.id == mock_task.id
     assert result.description == mock_task.description
@@ -109,6 +162,22 @@ def test_create_task(task_service, mock_task_repository):
 
     assert mock_task_repository.create.call_count == 1
 
+def test_create_many_applies_counters_once_per_priority(task_service, mock_task_repository):
+    dtos: Final[list[CreateTaskDTO]] = [
+        CreateTaskDTO(title="task one", priority=2),
+        CreateTaskDTO(title="task two", priority=2, is_done=True),
+        CreateTaskDTO(title="task three", priority=5, due_date=date(2030, 1, 1)),
+    ]
+    mock_task_repository.create_many.return_value = []
+
+    task_service.create_many(mock_user.id, dtos)
+
+    mock_task_repository.create_many.assert_called_once()
+    assert [task['user_id'] for task in mock_task_repository.create_many.call_args.args[0]] == [mock_user.id] * 3
+    assert mock_task_repository.apply_counter_delta.call_count == 2
+    mock_task_repository.apply_counter_delta.assert_any_call(mock_user.id, 2, 2, 1, 0, revision=1)
+    mock_task_repository.apply_counter_delta.assert_any_call(mock_user.id, 5, 1, 0, 1, revision=0)
+
 def test_change_status_done(task_service, mock_task_repository):
     task_copied: Final[TaskEntity] = copy.copy(mock_task)
     task_copied.is_done = not mock_task.is_done
@@ -122,6 +191,75 @@ def test_change_status_done(task_service, mock_task_repository):
 
     assert mock_task_repository.save.call_count == 1
 
+def test_change_status_done_moves_done_counter(task_service, mock_task_repository, mock_task_entity):
+    mock_task_entity.due_date = date(2030, 1, 1)
+
+    task_service.change_status_done(mock_task_entity)
+
+    mock_task_repository.apply_counter_delta.assert_called_once_with(mock_user.id, 1, 0, 1, -1, revision=1)
+
+def test_update_priority_moves_counters_between_priorities(task_service, mock_task_repository, mock_task_entity):
+    task_service.update(mock_task_entity, UpdateTaskDTO(priority=7))
+
+    assert mock_task_repository.apply_counter_delta.call_count == 2
+    mock_task_repository.apply_counter_delta.assert_any_call(mock_user.id, 1, -1, 0, 0, revision=1)
+    mock_task_repository.apply_counter_delta.assert_any_call(mock_user.id, 7, 1, 0, 0, revision=0)
+
+def test_update_title_only_bumps_revision(task_service, mock_task_repository, mock_task_entity):
+    task_service.update(mock_task_entity, UpdateTaskDTO(title="title only"))
+
+    mock_task_repository.apply_counter_delta.assert_called_once_with(mock_user.id, 1, 0, 0, 0, revision=1)
+
+def test_update_many_applies_counters(task_service, mock_task_repository, mock_task_entity):
+    task_updated: Final[TaskEntity] = copy.copy(mock_task_entity)
+    task_updated.is_done = True
+    mock_task_repository.update_many_user_id.return_value = ([mock_task_entity], [task_updated])
+
+    tasks = task_service.update_many(mock_user.id, MagicMock(), BulkUpdateTaskDTO(ids=[1], toggle_is_done=True))
+
+    assert [task.is_done for task in tasks] == [True]
+    mock_task_repository.apply_counter_delta.assert_called_once_with(mock_user.id, 1, 0, 1, 0, revision=1)
+
+def test_update_many_without_matches_skips_counters(task_service, mock_task_repository):
+    mock_task_repository.update_many_user_id.return_value = ([], [])
+
+    assert task_service.update_many(mock_user.id, MagicMock(), BulkUpdateTaskDTO(ids=[1], toggle_is_done=True)) == []
+    mock_task_repository.apply_counter_delta.assert_not_called()
+
+def test_delete_many_removes_counters_and_returns_ids(task_service, mock_task_repository, mock_task_entity):
+    mock_task_repository.delete_many_user_id.return_value = [mock_task_entity]
+
+    assert task_service.delete_many(mock_user.id, [1], MagicMock()) == [1]
+    mock_task_repository.apply_counter_delta.assert_called_once_with(mock_user.id, 1, -1, 0, 0, revision=1)
+
+def test_change_status_done_by_id_user_id_is_one_statement(task_service, mock_task_repository, mock_task_entity):
+    mock_task_entity.is_done = True
+    mock_task_repository.update_by_id_user_id.return_value = mock_task_entity
+    mock_task_repository.next_change_seq.return_value = 5
+
+    task_out = task_service.change_status_done_by_id_user_id(1, mock_user.id)
+
+    assert task_out.is_done == True
+    mock_task_repository.get_counter_state_by_id_user_id.assert_not_called()
+    mock_task_repository.update_by_id_user_id.assert_called_once_with(1, mock_user.id, {"change_seq": 5}, True)
+    mock_task_repository.apply_counter_delta.assert_called_once_with(mock_user.id, 1, 0, 1, 0, revision=1)
+
+def test_update_by_id_user_id_reads_previous_counted_fields(task_service, mock_task_repository, mock_task_entity):
+    mock_task_repository.get_counter_state_by_id_user_id.return_value = copy.copy(mock_task_entity)
+    mock_task_entity.priority = 7
+    mock_task_repository.update_by_id_user_id.return_value = mock_task_entity
+
+    task_service.update_by_id_user_id(1, mock_user.id, UpdateTaskDTO(priority=7))
+
+    mock_task_repository.apply_counter_delta.assert_any_call(mock_user.id, 1, -1, 0, 0, revision=1)
+    mock_task_repository.apply_counter_delta.assert_any_call(mock_user.id, 7, 1, 0, 0, revision=0)
+
+def test_update_by_id_user_id_returns_none_for_other_users(task_service, mock_task_repository):
+    mock_task_repository.update_by_id_user_id.return_value = None
+
+    assert task_service.update_by_id_user_id(1, 2, UpdateTaskDTO(title="title only")) is None
+    mock_task_repository.apply_counter_delta.assert_not_called()
+
 def test_update_only_title_and_desc(task_service, mock_task_repository):
     
     dto: Final[UpdateTaskDTO] = UpdateTaskDTO(
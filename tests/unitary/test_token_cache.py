@@ -0,0 +1,55 @@
+import time
+from typing import Final
+from api.configs.auth.token_cache import TokenCache
+
+def claims(sub: int, ttl: float = 60) -> dict:
+    return {"sub": str(sub), "email": f"user{sub}@example.com", "exp": time.time() + ttl}
+
+def test_get_returns_cached_claims_until_exp():
+    cache: Final[TokenCache] = TokenCache(max_size=10)
+    cache.put("live", claims(1))
+    cache.put("expired", claims(2, ttl=-1))
+
+    assert cache.get("live")["sub"] == "1"
+    assert cache.get("expired") is None
+    assert cache.get("unknown") is None
+    assert cache.metrics() == {"size": 1, "max_size": 10, "hits": 1, "misses": 2, "evictions": 0}
+
+def test_least_recently_used_token_is_evicted():
+    cache: Final[TokenCache] = TokenCache(max_size=2)
+    cache.put("first", claims(1))
+    cache.put("second", claims(2))
+    cache.get("first")
+    cache.put("third", claims(3))
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+    assert cache.metrics()["evictions"] == 1
+
+def test_invalidate_user_drops_all_of_their_tokens():
+    cache: Final[TokenCache] = TokenCache(max_size=10)
+    cache.put("access", claims(1))
+    cache.put("refresh", claims(1, ttl=600))
+    cache.put("other", claims(2))
+
+    cache.invalidate_user(1)
+
+    assert cache.get("access") is None
+    assert cache.get("refresh") is None
+    assert cache.get("other") is not None
+
+def test_cached_claims_are_copies():
+    cache: Final[TokenCache] = TokenCache(max_size=10)
+    cache.put("token", claims(1))
+
+    cache.get("token")["sub"] = "2"
+
+    assert cache.get("token")["sub"] == "1"
+
+def test_size_zero_disables_the_cache():
+    cache: Final[TokenCache] = TokenCache(max_size=0)
+    cache.put("token", claims(1))
+
+    assert cache.get("token") is None
+    assert cache.metrics()["size"] == 0
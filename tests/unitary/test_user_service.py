@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from api.services.providers.provider_user_service import UserServiceProvider
+from api.services.providers.provider_local_user_cache import LocalUserCacheProvider
 from api.models.entities.user_entity import UserEntity
 from api.models.schemas.user_schemas import CreateUserDTO, UpdateUserDTO
 from datetime import datetime
@@ -18,7 +19,7 @@ def mock_hash_password(monkeypatch):
 
 @pytest.fixture
 def user_service(mock_user_repository):
-    return UserServiceProvider(repository=mock_user_repository)
+    return UserServiceProvider(repository=mock_user_repository, cache=LocalUserCacheProvider(ttl=60))
 
 mock_user: Final[UserEntity] = UserEntity(
         id = 1,
@@ -129,6 +130,20 @@ def test_create_user(user_service, mock_user_repository):
 
     mock_user_repository.create.assert_called_once()
 
+def test_create_user_returns_none_when_email_is_taken_concurrently(user_service, mock_user_repository):
+    from sqlalchemy.exc import IntegrityError
+
+    dto = CreateUserDTO(
+        name = mock_user.name,
+        email = mock_user.email,
+        password = mock_user.password,
+    )
+
+    mock_user_repository.create.side_effect = IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed"))
+
+    assert user_service.create(dto) is None
+    mock_user_repository.savepoint.return_value.__exit__.assert_called_once()
+
 def test_update_user_with_name_and_password(user_service, mock_user_repository, mock_hash_password, mock_user_entity):
     dto = UpdateUserDTO(name="New Name", password="new_password123")
     
@@ -180,4 +195,48 @@ def test_update_user_with_no_changes(user_service, mock_user_repository, mock_ha
     assert updated_user.password == "old_hash"
     
     mock_hash_password.assert_not_called()
-    mock_user_repository.update.assert_called_once_with(updated_user)
\ No newline at end of file
+    mock_user_repository.update.assert_called_once_with(updated_user)
+
+def test_exists_by_id_queries_once_then_trusts_the_cache(user_service, mock_user_repository):
+    mock_user_repository.exists_by_id.return_value = True
+
+    assert user_service.exists_by_id(mock_user.id) == True
+    assert user_service.exists_by_id(mock_user.id) == True
+    mock_user_repository.exists_by_id.assert_called_once_with(mock_user.id)
+
+def test_exists_by_id_does_not_cache_missing_users(user_service, mock_user_repository):
+    mock_user_repository.exists_by_id.return_value = False
+
+    assert user_service.exists_by_id(2) == False
+    assert user_service.exists_by_id(2) == False
+    assert mock_user_repository.exists_by_id.call_count == 2
+
+def test_delete_invalidates_the_cached_user(user_service, mock_user_repository, mock_user_entity):
+    mock_user_repository.exists_by_id.return_value = True
+    user_service.exists_by_id(mock_user_entity.id)
+
+    user_service.delete(mock_user_entity)
+    mock_user_repository.exists_by_id.return_value = False
+
+    assert user_service.exists_by_id(mock_user_entity.id) == False
+
+def test_local_user_cache_forgets_users_after_ttl():
+    cache: Final[LocalUserCacheProvider] = LocalUserCacheProvider(ttl=0)
+    cache.add(1)
+
+    assert cache.contains(1) == False
+
+def test_local_user_cache_keeps_max_size():
+    cache: Final[LocalUserCacheProvider] = LocalUserCacheProvider(ttl=60, max_size=2)
+    for user_id in (1, 2, 3):
+        cache.add(user_id)
+
+    assert [cache.contains(user_id) for user_id in (1, 2, 3)] == [False, True, True]
+
+def test_update_user_with_password_hashed_beforehand(user_service, mock_user_repository, mock_hash_password, mock_user_entity):
+    mock_user_repository.update.return_value = mock_user_entity
+
+    user_service.update(mock_user_entity, UpdateUserDTO(password="new_password123"), "hashed_in_the_pool")
+
+    assert mock_user_entity.password == "hashed_in_the_pool"
+    mock_hash_password.assert_not_called()